@@ -1,13 +1,28 @@
+from importlib import import_module
+from importlib.util import find_spec
 from os.path import join, dirname
-from typing import Iterable, Union
+from threading import Thread, Timer
+from typing import Iterable, List, Union
 
 from ovos_utils import classproperty
 from ovos_utils.ocp import MediaType, PlaybackType, Playlist, MediaEntry
-from ovos_utils.parse import fuzzy_match, MatchStrategy
 from ovos_utils.process_utils import RuntimeRequirements
-from ovos_workshop.decorators import ocp_search
+from ovos_workshop.decorators import ocp_search, ocp_featured_media, ocp_play
 from ovos_workshop.skills.common_play import OVOSCommonPlaybackSkill
-from tutubo.ytmus import search_yt_music, MusicVideo, MusicAlbum, MusicPlaylist, MusicArtist
+
+from .artwork import ArtworkCache
+from .catalog import LocalCatalog
+from .featured import FeaturedPrefetcher
+from .lazy_playlist import LAZY_URI, PlaylistResolver, lazy_uri
+from .metrics import SearchMetrics, NULL_TRACE
+from .query import QueryParser
+from .records import ContainerRecord, record_key
+from .scoring import ResultScorer
+from .search_backend import (SearchAborted, stream_search_yt_music, sequential_search,
+                             submit_search, expand_records, is_expanded)
+from .search_cache import SearchCache
+from .search_core import AsyncSearchCore
+from .stream_resolver import StreamResolver, video_id_from_url
 
 
 class YoutubeMusicSkill(OVOSCommonPlaybackSkill):
@@ -17,147 +32,444 @@ class YoutubeMusicSkill(OVOSCommonPlaybackSkill):
                          skill_voc_filename="youtube_music_skill",
                          *args, **kwargs)
 
+    def initialize(self):
+        # shared by every MediaEntry/Playlist the skill builds
+        self._entry_header = {"skill_id": self.skill_id,
+                              "skill_icon": self.skill_icon}
+        self.metrics = SearchMetrics(enabled=self.settings.get("metrics", False))
+        self.add_event(f"{self.skill_id}.metrics.get", self.handle_get_metrics)
+        if self.settings.get("metrics_log_interval"):
+            self.schedule_repeating_event(
+                self.log_metrics, None,
+                self.settings["metrics_log_interval"],
+                name="ytmus_metrics_log")
+        self.query_parser = QueryParser(self.voc_list)
+        self.query_parser.compile(self.lang)
+        self.search_cache = SearchCache(
+            ttl=self.settings.get("cache_ttl", 24 * 3600),
+            stale_ttl=self.settings.get("cache_stale_ttl", 7 * 24 * 3600),
+            max_entries=self.settings.get("cache_size", 100),
+            max_disk_entries=self.settings.get("cache_disk_size", 500),
+            store_delay=self.settings.get("cache_write_delay", 5))
+        self.search_core = AsyncSearchCore(
+            max_concurrency=self.settings.get("search_workers", 4),
+            timeout=self.settings.get("request_timeout", 10))
+        self.playlist_resolver = PlaylistResolver()
+        self.stream_resolver = None
+        if self.settings.get("stream_prefetch", True):
+            if find_spec("yt_dlp") is None:
+                self.log.info("yt-dlp not installed, streams will not be pre-resolved")
+            else:
+                self.stream_resolver = StreamResolver(
+                    max_workers=self.settings.get("stream_workers", 2),
+                    margin=self.settings.get("stream_expiry_margin", 300))
+        self.artwork = None
+        # opt-in, file:// uris only work when the display runs on this host
+        if self.settings.get("artwork_cache", False):
+            self.artwork = ArtworkCache(
+                max_bytes=self.settings.get("artwork_cache_size", 50 * 1024 * 1024),
+                max_workers=self.settings.get("artwork_workers", 4),
+                size=self.settings.get("artwork_size", 512))
+        self.catalog = LocalCatalog(
+            max_entries=self.settings.get("catalog_size", 10000))
+        Thread(target=self._load_catalog, daemon=True).start()
+        self._warm_up_timer = None
+        if self.settings.get("warm_up", True):
+            # delayed so it does not compete with loading the other skills
+            self._warm_up_timer = Timer(self.settings.get("warm_up_delay", 2),
+                                        self._warm_up)
+            self._warm_up_timer.daemon = True
+            self._warm_up_timer.start()
+        self.featured = FeaturedPrefetcher(
+            self.fetch_all,
+            refresh=self.refresh_all,
+            max_workers=self.settings.get("featured_workers", 2),
+            min_interval=self.settings.get("featured_rate_limit", 1.0),
+            jitter=self.settings.get("featured_jitter", 0.5))
+        # warm up in the background, never blocks skill load
+        self.prefetch_featured()
+        self.schedule_repeating_event(
+            self.refresh_featured, None,
+            self.settings.get("featured_refresh_interval", 6 * 3600),
+            name="ytmus_featured_prefetch")
+
+    def _warm_up(self):
+        """ import the search dependencies in the background so the
+        first search does not pay for them, skill loading does not wait """
+        try:
+            for module in ("tutubo.ytmus", "ytmusicapi"):
+                import_module(module)
+        except Exception as e:
+            self.log.error(f"failed to pre-import search dependencies: {e}")
+
+    def _load_catalog(self):
+        try:
+            self.search_cache.load()
+            self.catalog.load_csv(join(dirname(__file__), "youtube.csv"))
+            for results in self.search_cache.iter_results():
+                self.catalog.add_results(results)
+        except Exception as e:
+            self.log.error(f"failed to load local catalog: {e}")
+
+    def handle_get_metrics(self, message):
+        self.bus.emit(message.response({"metrics": self.metrics.as_dict,
+                                        "prometheus": self.metrics.prometheus(),
+                                        "search_cache": self.search_cache.stats,
+                                        "search_core": self.search_core.stats,
+                                        "streams": self.stream_resolver.stats
+                                        if self.stream_resolver else None,
+                                        "artwork": self.artwork.stats
+                                        if self.artwork else None}))
+
+    def log_metrics(self, message=None):
+        self.log.info(f"search metrics: {self.metrics.summary()}")
+
+    def prefetch_featured(self, message=None):
+        queries = self.settings.get("featured") or []
+        if queries:
+            self.featured.start(queries)
+
+    def refresh_featured(self, message=None):
+        queries = self.settings.get("featured") or []
+        if queries:
+            self.featured.start(queries, refresh=True)
+
+    def shutdown(self):
+        if self._warm_up_timer is not None:
+            self._warm_up_timer.cancel()
+        self.featured.shutdown()
+        self.search_core.shutdown()
+        self.search_cache.flush()
+        if self.stream_resolver is not None:
+            self.stream_resolver.shutdown()
+        if self.artwork is not None:
+            self.artwork.shutdown()
+
     @classproperty
     def runtime_requirements(self):
-        return RuntimeRequirements(internet_before_load=True,
-                                   network_before_load=True,
+        # loads offline, searches fall back to the local catalog
+        # until youtube music can be reached
+        return RuntimeRequirements(internet_before_load=False,
+                                   network_before_load=False,
                                    gui_before_load=False,
                                    requires_internet=True,
                                    requires_network=True,
                                    requires_gui=False,
-                                   no_internet_fallback=False,
-                                   no_network_fallback=False,
+                                   no_internet_fallback=True,
+                                   no_network_fallback=True,
                                    no_gui_fallback=True)
 
-    def search_yt(self, phrase):
-        return search_yt_music(phrase, as_dict=False)
+    def search_yt(self, phrase, trace=NULL_TRACE, key=None, local=None):
+        """ `local` collects the record keys of results answered from the
+        local catalog instead of youtube """
+        key = key or self.search_cache.normalize(phrase)
+        results = self.featured.lookup(key)
+        if results is not None:
+            self.log.debug(f"featured match: {key}")
+            trace.count("featured_hits")
+            return results
+        # stale entries are refreshed like the search they stand in for,
+        # tracks of albums/artists/playlists only when playlists are not lazy
+        expand = not self.settings.get("lazy_playlists", True)
+        results = self.search_cache.get(
+            key, refresh=lambda: self._search_all(phrase, expand))
+        if results is not None:
+            self.log.debug(f"search cache hit: {key}")
+            trace.count("cache_hits")
+            return results
+        trace.count("cache_misses")
+        return self._search_and_cache(key, phrase, trace, local)
 
-    # score
-    def calc_score(self, phrase, match, idx=0, base_score=0,
-                   media_type=MediaType.GENERIC) -> int:
-        # idx represents the order from youtube
-        score = base_score - idx * 5  # - 5% as we go down the results list
+    def _search_and_cache(self, key, phrase, trace=NULL_TRACE, local=None):
+        local = local if local is not None else set()
+        lazy = self.settings.get("lazy_playlists", True)
+        search_fut = None
+        if self.settings.get("stream_search", True) or lazy:
+            # sent before the local answers below are yielded
+            search_fut = submit_search(phrase, self.search_core)
+            upstream = stream_search_yt_music(
+                phrase, self.search_core,
+                timeout=self.settings.get("search_timeout", 4),
+                expand_containers=not lazy,
+                stop_event=self._stop_event,
+                search_fut=search_fut,
+                trace=trace)
+        else:
+            upstream = sequential_search(phrase)
+        yielded = set()
+        results = []
+        complete = True
+        try:
+            # results of previous searches that match well are answered
+            # right away, youtube results are still to come
+            if self.settings.get("local_answers", True):
+                min_score = self.settings.get("local_min_score", 0.8)
+                for m in self.search_local(phrase):
+                    if m.result is not None and m.score >= min_score and \
+                            record_key(m.result) not in yielded:
+                        yielded.add(record_key(m.result))
+                        local.add(record_key(m.result))
+                        yield m.result
+            for r in upstream:
+                complete = complete and (lazy or is_expanded(r))
+                results.append(r)
+                if record_key(r) not in yielded:
+                    yield r
+        except SearchAborted as e:
+            # OCP closed the search window, a partial list is not cached
+            self.log.debug(str(e))
+            return
+        except Exception as e:
+            # includes youtube not answering before the search deadline
+            self.log.warning(f"youtube music search failed, "
+                             f"using local catalog: {e}")
+            yielded.update(record_key(r) for r in results)
+            for m in self.search_local(phrase):
+                if m.result is not None and record_key(m.result) not in yielded:
+                    yielded.add(record_key(m.result))
+                    local.add(record_key(m.result))
+                    yield m.result
+            return
+        finally:
+            if search_fut is not None:
+                # OCP may close this generator before upstream was read
+                search_fut.cancel()
+        self.catalog.add_results(results)
+        # only cache searches that were consumed until the end
+        # and where every album/artist/playlist got its tracks
+        if complete:
+            self.search_cache.put(key, results)
+
+    def search_local(self, phrase):
+        """ match phrase against known artists/songs/playlists without network """
+        return self.catalog.search(phrase)
 
-        if isinstance(match, MusicVideo):
-            score -= 10  # penalty for video results
+    def fetch_all(self, phrase):
+        """ blocking search that fully expands every result,
+        meant for background work that is not bound by OCP timeouts """
+        key = self.search_cache.normalize(phrase)
+        results = self.search_cache.get(key, stale=False)
+        if results is None:
+            try:
+                return self.refresh_all(phrase)
+            except Exception:
+                # stale results are better than none while offline
+                results = self.search_cache.get(key)
+                if results is None:
+                    raise
+        if not all(is_expanded(r) for r in results):
+            # cached by a lazy search, albums/artists/playlists have no tracks
+            results = expand_records(results, self.search_core)
+            if all(is_expanded(r) for r in results):
+                self.search_cache.put(key, results)
+        return results
 
-        if match.artist:
-            score += 80 * fuzzy_match(phrase.lower(), match.artist.lower(),
-                                      strategy=MatchStrategy.TOKEN_SET_RATIO)
-        if match.title:
-            score += 80 * fuzzy_match(phrase.lower(), match.title.lower(),
-                                      strategy=MatchStrategy.DAMERAU_LEVENSHTEIN_SIMILARITY)
+    def refresh_all(self, phrase):
+        """ like fetch_all but never answered from the cache """
+        results = self._search_all(phrase)
+        self.search_cache.put(self.search_cache.normalize(phrase), results)
+        return results
 
-        if media_type == MediaType.GENERIC:
-            score -= 10
-        return min(100, score)
+    def _search_all(self, phrase, expand=True):
+        # through the search core, background searches share its
+        # concurrency limit and coalesce with searches in flight
+        return list(stream_search_yt_music(phrase, self.search_core,
+                                           expand_containers=expand))
+
+    # score
+    def calc_score(self, phrase, match, idx=0, base_score=0,
+                   media_type=MediaType.GENERIC) -> int:
+        return ResultScorer(phrase, base_score, media_type).score(match, idx)
 
     # common play
     @ocp_search()
     def search_youtube_music(self, phrase, media_type) -> Iterable[Union[MediaEntry, Playlist]]:
-        # match the request media_type
-        base_score = 0
-        if media_type == MediaType.MUSIC:
-            base_score += 10
+        trace = self.metrics.start_query()
+        try:
+            yield from self._search_youtube_music(phrase, media_type, trace)
+        finally:
+            trace.finish()
+
+    def _search_youtube_music(self, phrase, media_type, trace):
+        with trace.span("preprocess"):
+            # match the request media_type
+            base_score = 0
+            if media_type == MediaType.MUSIC:
+                base_score += 10
+
+            query = self.query_parser.parse(phrase, self.lang)
+            if query.explicit:
+                # explicitly requested youtube
+                base_score += 50
+            phrase = query.phrase
 
-        if self.voc_match(phrase, "youtube"):
-            # explicitly requested youtube
-            base_score += 50
-            phrase = self.remove_voc(phrase, "youtube")
+            if media_type == MediaType.GENERIC:
+                # a known artist/song name means this is a music request
+                local = self.search_local(query.key)
+                if local and local[0].score >= 0.8 and \
+                        local[0].label in ("artist_name", "song_name", "album_name"):
+                    base_score += 10
+
+        scorer = ResultScorer(query.key, base_score, media_type)
+        local = set()
+        results = self.search_yt(phrase, trace, query.key, local)
+        scores = None
+        if isinstance(results, list):
+            # cached results can be scored in one go
+            with trace.span("score"):
+                scores = scorer.score_results(results)
+
+        # streams of well scored songs are resolved while OCP is still
+        # collecting results, OCP may stop reading before the last one
+        prefetch_left = 0
+        if self.stream_resolver is not None:
+            prefetch_left = self.settings.get("stream_prefetch_count", 3)
+            if scores is not None:
+                self.stream_resolver.prefetch_best(
+                    [(score, r.video_id, r.watch_url)
+                     for r, score in zip(results, scores)
+                     if not isinstance(r, ContainerRecord)],
+                    top_n=prefetch_left)
+                prefetch_left = 0
+        min_prefetch_score = self.settings.get("stream_prefetch_min_score", 50)
 
         idx = 0
-        for v in self.search_yt(phrase):
-            if isinstance(v, MusicPlaylist):
-                # albums / artists / playlists
-                score = self.calc_score(phrase, v, idx,
-                                        base_score=base_score,
-                                        media_type=media_type)
-                if isinstance(v, MusicArtist):
-                    title = v.artist + " (Featured Tracks)"
-                elif isinstance(v, MusicAlbum):
-                    title = v.title + " (Full Album)"
-                elif isinstance(v, MusicPlaylist):
-                    title = v.title + " (Playlist)"
+        images = set()
+        try:
+            for i, v in enumerate(trace.timed("upstream", results)):
+                trace.count(f"results_{v.kind}")
+                if scores is None:
+                    with trace.span("score"):
+                        score = scorer.score(v, idx)
                 else:
-                    title = v.title
-                pl = Playlist(title=title,
-                              artist=v.artist,
-                              match_confidence=score,
-                              skill_id=self.skill_id,
-                              skill_icon=self.skill_icon,
-                              playback=PlaybackType.AUDIO,
-                              media_type=MediaType.MUSIC)
-                for e in v.tracks:
-                    pl.append(MediaEntry(
-                        uri=e.watch_url,
-                        match_confidence=score,
-                        playback=PlaybackType.AUDIO,
-                        media_type=MediaType.MUSIC,
-                        length=e.length * 1000 if e.length else 0,
-                        image=e.thumbnail_url,
-                        title=e.title,
-                        artist=e.artist,
-                        skill_id=self.skill_id,
-                        skill_icon=self.skill_icon
-                    ))
-                if pl:
-                    yield pl
+                    score = scores[i]
+                if isinstance(v, ContainerRecord):
+                    # albums / artists / playlists
+                    if v.kind == "artist":
+                        title = v.artist + " (Featured Tracks)"
+                    elif v.kind == "album":
+                        title = v.title + " (Full Album)"
+                    else:
+                        title = v.title + " (Playlist)"
+                    if self.settings.get("lazy_playlists", True) or not v.expanded:
+                        # tracks are only fetched if OCP plays this entry
+                        with trace.span("build"):
+                            uri = lazy_uri(v)
+                            self.playlist_resolver.seed(uri, v)
+                            entry = MediaEntry(uri=uri,
+                                               title=title,
+                                               artist=v.artist,
+                                               image=self._image(v.image),
+                                               match_confidence=score,
+                                               playback=PlaybackType.SKILL,
+                                               media_type=MediaType.MUSIC,
+                                               **self._entry_header)
+                        images.add(v.image)
+                        trace.mark_yield()
+                        yield entry
+                        continue
+                    tracks = v.tracks
+                    trace.count("tracks_expanded", len(tracks))
+                    with trace.span("score"):
+                        track_scores = scorer.score_tracks(tracks, idx)
+                    with trace.span("build"):
+                        pl = Playlist(title=title,
+                                      artist=v.artist,
+                                      match_confidence=score,
+                                      playback=PlaybackType.AUDIO,
+                                      media_type=MediaType.MUSIC,
+                                      **self._entry_header)
+                        for e, track_score in zip(tracks, track_scores):
+                            pl.append(self._track_entry(e, track_score))
+                            images.add(e.image)
+                    if pl:
+                        trace.mark_yield()
+                        yield pl
+                else:
+                    # videos / songs
+                    # return as a video result (single track dict)
+                    with trace.span("build"):
+                        entry = self._track_entry(v, score)
+                        if self.stream_resolver is not None:
+                            # played by play_skill_entry, which can use a
+                            # stream resolved while OCP picks a result
+                            entry.playback = PlaybackType.SKILL
+                    if prefetch_left and score >= min_prefetch_score:
+                        self.stream_resolver.prefetch(v.video_id, v.watch_url)
+                        prefetch_left -= 1
+                    images.add(v.image)
+                    trace.mark_yield()
+                    yield entry
+                    # local answers come first, they do not push
+                    # youtube songs down the ranking
+                    if record_key(v) not in local:
+                        idx += 1
+
+        finally:
+            # also when OCP stops reading before the last result
+            if self.artwork is not None:
+                self.artwork.prefetch(images)
+
+    def _image(self, url: str) -> str:
+        """ local copy of a thumbnail once the artwork cache has it """
+        if self.artwork is None:
+            return url
+        return self.artwork.image(url)
+
+    def _track_entry(self, track, score=0) -> MediaEntry:
+        entry = track.to_media_entry(score, **self._entry_header)
+        entry.image = self._image(entry.image)
+        return entry
+
+    @ocp_play()
+    def play_skill_entry(self, message):
+        """ hand a track or the tracks of a lazy album/artist/playlist to OCP """
+        media = message.data.get("media") or message.data
+        uri = media.get("uri", "")
+        if not uri.startswith(LAZY_URI):
+            self.play_track(media, message)
+            return
+        with self.metrics.span("resolve"):
+            tracks = self.playlist_resolver.resolve(uri)
+        if not tracks:
+            self.log.error(f"no tracks found for {uri}")
+            return
+        score = media.get("match_confidence", 0)
+        playlist = [self._track_entry(t, score).as_dict for t in tracks]
+        self.play_media(playlist[0], playlist=playlist)
+
+    def play_track(self, media: dict, message):
+        """ play a track, from its pre-resolved stream if there is one,
+        otherwise the audio backend extracts the stream from the watch url
+
+        OCP's playlist and search results are passed through, only the
+        entry of this track is replaced
+        """
+        uri = media.get("uri", "")
+        stream = None
+        if self.stream_resolver is not None:
+            stream = self.stream_resolver.get(
+                video_id_from_url(uri),
+                timeout=self.settings.get("stream_wait", 2))
+        track = dict(media, uri=stream or uri,
+                     image=self._image(media.get("image", "")),
+                     playback=PlaybackType.AUDIO)
+
+        def replace(entries):
+            return [track if e.get("uri") == uri else e for e in entries or ()]
+
+        self.play_media(track,
+                        disambiguation=replace(message.data.get("disambiguation")) or None,
+                        playlist=replace(message.data.get("playlist")) or None)
+
+    @ocp_featured_media()
+    def featured_media(self) -> List[MediaEntry]:
+        entries = []
+        for v in self.featured.results:
+            if isinstance(v, ContainerRecord):
+                entries += [self._track_entry(e) for e in v.tracks or ()]
             else:
-                # videos / songs
-                score = self.calc_score(phrase, v, idx,
-                                        base_score=base_score,
-                                        media_type=media_type)
-                # return as a video result (single track dict)
-                entry = MediaEntry(
-                    uri=v.watch_url,
-                    match_confidence=score,
-                    playback=PlaybackType.AUDIO,
-                    media_type=MediaType.VIDEO if isinstance(v, MusicVideo) else MediaType.MUSIC,
-                    length=v.length * 1000 if v.length else 0,
-                    image=v.thumbnail_url,
-                    title=v.title,
-                    artist=v.artist,
-                    skill_id=self.skill_id,
-                    skill_icon=self.skill_icon
-                )
-                yield entry
-                idx += 1
-
-
-if __name__ == "__main__":
-    from ovos_utils.messagebus import FakeBus
-
-    s = YoutubeMusicSkill(bus=FakeBus(), skill_id="t.fake")
-
-    for r in s.search_youtube_music("zz top", MediaType.MUSIC):
-        print(r)
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 443000, 'uri': 'youtube//https://music.youtube.com/watch?v=X4jyfV_-WAw', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'ZZ Top - 08 Sure Got Cold After The Rain Fell - Rio Grande Mud 1972 mix', 'album': 'Z Z Top (The Blues)', 'artist': 'creepingthrash', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 420000, 'uri': 'youtube//https://music.youtube.com/watch?v=b76kjd5nvMg', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'ZZ TOP - Blue Jean Blues', 'album': 'Z Z Top (The Blues)', 'artist': 'Tomi_C', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 211000, 'uri': 'youtube//https://music.youtube.com/watch?v=vMjqgIZ1_YM', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'ZZ Top - Jesus Just Left Chicago', 'album': 'Z Z Top (The Blues)', 'artist': 'thenoname365', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 257000, 'uri': 'youtube//https://music.youtube.com/watch?v=Uv4B0xK8rNs', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': "ZZ Top 'A Fool For Your Stockings'", 'album': 'Z Z Top (The Blues)', 'artist': 'wolftrack57', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 206000, 'uri': 'youtube//https://music.youtube.com/watch?v=MCBYpv8MmtY', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'ZZ Top - Asleep In The Desert [Instrumental]', 'album': 'Z Z Top (The Blues)', 'artist': 'joeybbbbbz', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 362000, 'uri': 'youtube//https://music.youtube.com/watch?v=0s5Hv4EoBAQ', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'ZZ Top - Vincent Price Blues (1996)', 'album': 'Z Z Top (The Blues)', 'artist': 'Rudy Doo', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 335000, 'uri': 'youtube//https://music.youtube.com/watch?v=nPdcuhb-kJY', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'Goin So Good - ZZ Top with lyrics', 'album': 'Z Z Top (The Blues)', 'artist': 'yollom600', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 271000, 'uri': 'youtube//https://music.youtube.com/watch?v=MOxMMNyIxCE', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'ZZ Top - Over You', 'album': 'Z Z Top (The Blues)', 'artist': 'XxXPLAYERONEXxX', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 315000, 'uri': 'youtube//https://music.youtube.com/watch?v=5OhaJfpu9ic', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'ZZ top - Made into a movie', 'album': 'Z Z Top (The Blues)', 'artist': 'MrSP0T', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 379000, 'uri': 'youtube//https://music.youtube.com/watch?v=pGr4NHj92rY', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'ZZ Top - I Need You Tonight', 'album': 'Z Z Top (The Blues)', 'artist': 'Metal8909', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 254000, 'uri': 'youtube//https://music.youtube.com/watch?v=j9CAjoBg7Qw', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': "ZZ Top - Just Got Back From Baby's", 'album': 'Z Z Top (The Blues)', 'artist': 'Kilo2199', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 214000, 'uri': 'youtube//https://music.youtube.com/watch?v=oi23gO8u_Uw', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'ZZ Top - Old Man', 'album': 'Z Z Top (The Blues)', 'artist': 'Kilo2199', 'skill_id': 't.fake'}
-        # {'match_confidence': 90, 'media_type': <MediaType.MUSIC: 2>, 'length': 404000, 'uri': 'youtube//https://music.youtube.com/watch?v=kSHhAkVreiw', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'bg_image': 'https://yt3.ggpht.com/WJUxM-ld-EV397QjrzHHvd4zL3aQc0c702ZdyYJI6EDHDKoZ9cMe0X-yrgbHRkRbLaxQuebzDNo=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'ZZ Top - Breakaway', 'album': 'Z Z Top (The Blues)', 'artist': 'MasaccioGlamour', 'skill_id': 't.fake'}
-
-    for r in s.search_youtube_music("frank sinatra ai covers", MediaType.MUSIC):
-        print(r)
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 288000, 'uri': 'youtube//https://music.youtube.com/watch?v=SCXZ8_znoE4', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://yt3.ggpht.com/kMnjAFHNa_GkRdMSB0WPOZ_L7bZ3sjTRutYVlmV7BxP6ZuuwJFYRsNSGL0p25alCrG4KX1r20_E=s1200', 'bg_image': 'https://yt3.ggpht.com/kMnjAFHNa_GkRdMSB0WPOZ_L7bZ3sjTRutYVlmV7BxP6ZuuwJFYRsNSGL0p25alCrG4KX1r20_E=s1200', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'Pavlo Ilnytskyy – My Way [Live, Frank Sinatra Cover]', 'album': 'Frank Sinatra covers', 'artist': 'Pavlo Ilnytskyy', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 215000, 'uri': 'youtube//https://music.youtube.com/watch?v=_LvrA0fJcI0', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'as the world caves in  - (Frank Sinatra A.I Cover)', 'album': 'Frank Sinatra AI', 'artist': 'the ai man', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 239000, 'uri': 'youtube//https://music.youtube.com/watch?v=9CC_mvhjXE0', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'Frank Sinatra Sings Just The Two Of Us ( AI Voice Cover)', 'album': 'Frank Sinatra AI', 'artist': 'PGCFusion', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 189000, 'uri': 'youtube//https://music.youtube.com/watch?v=gauYC0Td7Jk', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'Sway by Frank Sinatra (AI Cover)', 'album': 'Frank Sinatra AI', 'artist': 'aidar', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 144000, 'uri': 'youtube//https://music.youtube.com/watch?v=Ikr9mVDMnXM', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': "AI Frank Sinatra - Ain't That A Kick In The Head (Dean Martin Cover)", 'album': 'Frank Sinatra AI', 'artist': 'AI COVERS', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 243000, 'uri': 'youtube//https://music.youtube.com/watch?v=FmIqdyNvYsw', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'Feeling Good - Frank Sinatra (Original by Michael Bublé) (AI COVER)', 'album': 'Frank Sinatra AI', 'artist': 'WhoAmI AiCover', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 255000, 'uri': 'youtube//https://music.youtube.com/watch?v=dZGGBT1KEOc', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'AI Frank Sinatra - What A Wonderful World (Louis Armstrong Cover)', 'album': 'Frank Sinatra AI', 'artist': 'AI COVERS', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 265000, 'uri': 'youtube//https://music.youtube.com/watch?v=mbr28MMU9cw', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'a-ha - Take On Me - Frank Sinatra (AI Jazz Cover)', 'album': 'Frank Sinatra AI', 'artist': 'AI Sings', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 238000, 'uri': 'youtube//https://music.youtube.com/watch?v=aU3AWfjCNFc', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'Frank Sinatra - Thriller (AI COVER) (IN THE STYLE OF FRANK SINATRA)', 'album': 'Frank Sinatra AI', 'artist': 'JechucamTF2', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 111000, 'uri': 'youtube//https://music.youtube.com/watch?v=pvTvU0Vr9co', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'AI Frank Sinatra - L-O-V-E (Nat King Cole Cover)', 'album': 'Frank Sinatra AI', 'artist': 'AI COVERS', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 222000, 'uri': 'youtube//https://music.youtube.com/watch?v=q6hUd_TVW54', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'Frank Sinatra (A.I Cover) - ‘Five Nights at Freddy’s’ (Color Coded Lyrics)', 'album': 'Frank Sinatra AI', 'artist': 'SuperCraft 85', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 236000, 'uri': 'youtube//https://music.youtube.com/watch?v=kvG7xF03tG0', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'Feeling Good - Frank Sinatra (AI Cover)', 'album': 'Frank Sinatra AI', 'artist': 'ZaCool27', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 281000, 'uri': 'youtube//https://music.youtube.com/watch?v=62MvAtdIUrw', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'Frank Sinatra - Mr. Blue Sky (AI COVER)', 'album': 'Frank Sinatra AI', 'artist': 'Foamy', 'skill_id': 't.fake'}
-        # {'match_confidence': 100, 'media_type': <MediaType.MUSIC: 2>, 'length': 362000, 'uri': 'youtube//https://music.youtube.com/watch?v=VNWudHD3Kt8', 'playback': <PlaybackType.AUDIO: 2>, 'image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'bg_image': 'https://i.ytimg.com/vi/_LvrA0fJcI0/hqdefault.jpg?sqp=-oaymwEWCMACELQBIAQqCghQEJADGFogjgJIWg&rs=AMzJL3k-VuOFKLYIlJNi_JDaC2TbjHOaPg', 'skill_icon': 'https://github.com/OpenVoiceOS/ovos-ocp-audio-plugin/raw/master/ovos_plugin_common_play/ocp/res/ui/images/ocp.png', 'title': 'Bohemian Rhapsody - Frank Sinatra (AI COVER) Queen / Marc Martel', 'album': 'Frank Sinatra AI', 'artist': 'breezy', 'skill_id': 't.fake'}
+                entries.append(self._track_entry(v))
+        if self.artwork is not None:
+            self.artwork.prefetch(e.image for e in entries)
+        return entries
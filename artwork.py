@@ -0,0 +1,169 @@
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from os.path import isdir, join
+from threading import Lock
+from typing import Callable, Iterable, Optional
+from urllib.request import Request, urlopen
+
+from ovos_utils.log import LOG
+from ovos_utils.xdg_utils import xdg_cache_home
+
+# google image cdn urls end with size options, eg. "=s1200" or "=w544-h544-l90-rj"
+_GOOGLE_SIZE = re.compile(r"=[swh]\d+[^/=]*$")
+
+
+def download(url: str, timeout: float = 10) -> bytes:
+    req = Request(url, headers={"User-Agent": "Mozilla/5.0"})
+    with urlopen(req, timeout=timeout) as r:
+        return r.read()
+
+
+def sized_url(url: str, size: int) -> str:
+    """ ask googleusercontent/ggpht for an image of at most `size` pixels """
+    if ("ggpht.com" in url or "googleusercontent.com" in url) \
+            and _GOOGLE_SIZE.search(url):
+        return _GOOGLE_SIZE.sub(f"=s{size}", url)
+    return url
+
+
+def resize(data: bytes, size: int) -> bytes:
+    """ downscale to fit `size` pixels, needs Pillow, returns data as is without it """
+    try:
+        from PIL import Image  # optional dependency
+    except ImportError:
+        return data
+    img = Image.open(BytesIO(data))
+    if max(img.size) <= size:
+        return data
+    img.thumbnail((size, size))
+    out = BytesIO()
+    img.convert("RGB").save(out, "JPEG", quality=85)
+    return out.getvalue()
+
+
+class ArtworkCache:
+    """ local copies of result thumbnails
+
+    thumbnail urls are deduplicated and downloaded in a small thread pool,
+    images are stored downscaled to `size` pixels in
+    ~/.cache/OCP/YoutubeArtwork, once an image is on disk `local` returns
+    a file:// uri for it
+
+    files are evicted least recently used first to keep the folder under
+    `max_bytes`
+    """
+
+    def __init__(self, max_bytes: int = 50 * 1024 * 1024,
+                 max_workers: int = 4,
+                 size: int = 512,
+                 path: Optional[str] = None,
+                 fetch: Callable[[str], bytes] = download):
+        self.max_bytes = max_bytes
+        self.size = size
+        self.path = path or join(xdg_cache_home(), "OCP", "YoutubeArtwork")
+        self.fetch = fetch
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="ytmus-artwork")
+        self._files = OrderedDict()  # file name -> size in bytes, LRU order
+        self._pending = set()
+        self._lock = Lock()
+        self.total_bytes = 0
+        self.downloads = 0
+        self.evictions = 0
+        self._load()
+
+    def _load(self):
+        if not isdir(self.path):
+            os.makedirs(self.path, exist_ok=True)
+            return
+        files = []
+        for name in os.listdir(self.path):
+            if name.endswith(".tmp"):
+                continue
+            st = os.stat(join(self.path, name))
+            files.append((st.st_mtime, name, st.st_size))
+        for _, name, size in sorted(files):
+            self._files[name] = size
+            self.total_bytes += size
+        self._evict()
+
+    @property
+    def stats(self) -> dict:
+        return {"files": len(self._files),
+                "bytes": self.total_bytes,
+                "downloads": self.downloads,
+                "evictions": self.evictions,
+                "pending": len(self._pending)}
+
+    @staticmethod
+    def _name(url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest() + ".jpg"
+
+    def local(self, url: str) -> Optional[str]:
+        """ file:// uri of the cached copy of `url`, None if not cached """
+        if not url or url.startswith("file://"):
+            return url or None
+        name = self._name(url)
+        with self._lock:
+            if name not in self._files:
+                return None
+            self._files.move_to_end(name)
+        path = join(self.path, name)
+        try:
+            os.utime(path)  # keeps LRU order across restarts
+        except FileNotFoundError:
+            with self._lock:
+                self.total_bytes -= self._files.pop(name, 0)
+            return None
+        return f"file://{path}"
+
+    def image(self, url: str) -> str:
+        """ local copy of `url` if cached, `url` otherwise """
+        return self.local(url) or url
+
+    def prefetch(self, urls: Iterable[str]):
+        """ download every url not cached yet, returns immediately """
+        for url in set(urls):
+            if not url or url.startswith("file://"):
+                continue
+            name = self._name(url)
+            with self._lock:
+                if name in self._files or name in self._pending:
+                    continue
+                self._pending.add(name)
+            self._pool.submit(self._download, url, name)
+
+    def _download(self, url: str, name: str):
+        try:
+            data = resize(self.fetch(sized_url(url, self.size)), self.size)
+            path = join(self.path, name)
+            with open(path + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+            with self._lock:
+                self._files[name] = len(data)
+                self.total_bytes += len(data)
+                self.downloads += 1
+                self._evict()
+        except Exception as e:
+            LOG.debug(f"failed to cache artwork {url}: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(name)
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and len(self._files) > 1:
+            name, size = self._files.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(join(self.path, name))
+            except FileNotFoundError:
+                pass
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,66 @@
+"""bytes per query held by search results, tutubo objects vs result records
+
+    python benchmarks/bench_memory.py
+
+for every recorded query the responses are decoded fresh, like ytmusicapi
+does for each http response, and the fully expanded results are kept in
+both representations, the report has per query:
+    retained bytes of the tutubo objects (raw youtube data included)
+    retained bytes of the records the skill keeps instead
+    bytes of the cache entry on disk in the old and the new format
+
+the report is printed as json
+"""
+import gc
+import json
+import tracemalloc
+from importlib import import_module
+
+from recorded import import_skill, load_recorded, recorded_results
+
+records = import_skill().records
+
+
+def retained(build):
+    """ bytes still allocated by the object `build` returns """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    obj = build()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, after - before
+
+
+def fresh_results(query, recorded):
+    return recorded_results(query, {query: json.loads(json.dumps(recorded[query]))})
+
+
+def main():
+    # the skill imports tutubo lazily, keep the import out of the first query
+    import_module("tutubo.ytmus")
+    recorded = load_recorded()
+    report = {}
+    for query in recorded:
+        results, tutubo_bytes = retained(lambda: fresh_results(query, recorded))
+        del results
+        recs, record_bytes = retained(
+            lambda: [records.to_record(r) for r in fresh_results(query, recorded)])
+        old_disk = json.dumps([{"type": r.__class__.__name__, "data": r._raw_data}
+                               for r in fresh_results(query, recorded)])
+        new_disk = json.dumps(records.dump_records(recs))
+        report[query] = {
+            "results": len(recs),
+            "tracks": sum(len(r.tracks) for r in recs
+                          if isinstance(r, records.ContainerRecord)),
+            "tutubo_bytes": tutubo_bytes,
+            "record_bytes": record_bytes,
+            "disk_bytes_before": len(old_disk.encode("utf-8")),
+            "disk_bytes_after": len(new_disk.encode("utf-8")),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""compare QueryParser against voc_match + remove_voc for the youtube keyword
+
+    python benchmarks/bench_query.py [-n ITERATIONS] [--output FILE]
+
+prints a json report per language, or writes it to --output, exits with
+an error if the two paths disagree on whether youtube was requested
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# keep the benchmark away from the real cache/config folders
+_TMP = tempfile.mkdtemp(prefix="ytmus-bench-")
+for _var in ("XDG_CACHE_HOME", "XDG_CONFIG_HOME", "XDG_DATA_HOME"):
+    os.environ[_var] = os.path.join(_TMP, _var.lower())
+
+from ovos_utils.fakebus import FakeBus
+
+from recorded import import_skill
+
+skill_module = import_skill()
+
+PHRASES = [
+    "zz top",
+    "frank sinatra ai covers",
+    "play zz top on youtube",
+    "zz top youtube music",
+    "frank sinatra on you tube music",
+    "youtube music skill play the beatles",
+    "António Variações",
+    "la grange by zz top from youtube",
+    "youtuber compilation",
+    "the best of louis armstrong and ella fitzgerald live in berlin",
+]
+LANGS = ["en-US", "de-DE", "it-IT"]
+
+
+def legacy_parse(skill, phrase, lang):
+    if skill.voc_match(phrase, "youtube", lang):
+        return skill.remove_voc(phrase, "youtube", lang), True
+    return phrase, False
+
+
+def timeit(func, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--iterations", type=int, default=1000)
+    parser.add_argument("--output", help="write the json report to this file")
+    args = parser.parse_args()
+
+    skill = skill_module.YoutubeMusicSkill(bus=FakeBus(), skill_id="bench.ytmus")
+    report = {"iterations": args.iterations, "langs": {}}
+    agree = True
+    for lang in LANGS:
+        compile_us = timeit(
+            lambda: skill_module.query.QueryParser(skill.voc_list).compile(lang), 20)
+        queries = {}
+        for phrase in PHRASES:
+            old, old_explicit = legacy_parse(skill, phrase, lang)
+            new = skill.query_parser.parse(phrase, lang)
+            agree = agree and old_explicit == new.explicit
+            queries[phrase] = {"legacy": old, "parsed": new.phrase,
+                               "key": new.key, "explicit": new.explicit,
+                               "same_detection": old_explicit == new.explicit}
+        report["langs"][lang] = {
+            "compile_us": compile_us,
+            "legacy_us_per_query": timeit(
+                lambda: [legacy_parse(skill, p, lang) for p in PHRASES],
+                args.iterations) / len(PHRASES),
+            "parser_us_per_query": timeit(
+                lambda: [skill.query_parser.parse(p, lang) for p in PHRASES],
+                args.iterations) / len(PHRASES),
+            "queries": queries}
+    skill.shutdown()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    else:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    if not agree:
+        sys.exit("QueryParser and voc_match disagree")
+
+
+if __name__ == "__main__":
+    main()
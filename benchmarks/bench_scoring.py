@@ -0,0 +1,124 @@
+"""compare ResultScorer against the previous per result calc_score
+
+    python benchmarks/bench_scoring.py [-n ITERATIONS]
+
+prints a json report, exits with an error if any score differs
+"""
+import argparse
+import json
+import sys
+import time
+
+from ovos_utils.ocp import MediaType
+from ovos_utils.parse import fuzzy_match, MatchStrategy
+from tutubo.ytmus import MusicArtist, MusicPlaylist, MusicVideo
+
+from recorded import import_skill, load_recorded, recorded_results
+
+skill = import_skill()
+ResultScorer = skill.scoring.ResultScorer
+ContainerRecord = skill.records.ContainerRecord
+to_record = skill.records.to_record
+
+
+def legacy_calc_score(phrase, match, idx=0, base_score=0,
+                      media_type=MediaType.GENERIC):
+    score = base_score - idx * 5
+    if isinstance(match, MusicVideo):
+        score -= 10
+    if match.artist:
+        score += 80 * fuzzy_match(phrase.lower(), match.artist.lower(),
+                                  strategy=MatchStrategy.TOKEN_SET_RATIO)
+    if match.title:
+        score += 80 * fuzzy_match(phrase.lower(), match.title.lower(),
+                                  strategy=MatchStrategy.DAMERAU_LEVENSHTEIN_SIMILARITY)
+    if media_type == MediaType.GENERIC:
+        score -= 10
+    return min(100, score)
+
+
+def legacy_scores(phrase, results, base_score, media_type):
+    scores = []
+    idx = 0
+    for r in results:
+        scores.append(legacy_calc_score(phrase, r, idx, base_score, media_type))
+        if not isinstance(r, (MusicPlaylist, MusicArtist)):
+            idx += 1
+    return scores
+
+
+def batch_scores(phrase, results, base_score, media_type):
+    return ResultScorer(phrase, base_score, media_type).score_results(results)
+
+
+def legacy_track_scores(phrase, results, base_score, media_type):
+    # tracks used to inherit the score of their container,
+    # this is what scoring them individually with calc_score costs
+    scores = []
+    idx = 0
+    for r in results:
+        if isinstance(r, (MusicPlaylist, MusicArtist)):
+            scores += [legacy_calc_score(phrase, t, idx, base_score, media_type)
+                       for t in r.tracks]
+        else:
+            idx += 1
+    return scores
+
+
+def batch_track_scores(phrase, results, base_score, media_type):
+    scorer = ResultScorer(phrase, base_score, media_type)
+    scores = []
+    idx = 0
+    for r in results:
+        if isinstance(r, ContainerRecord):
+            scores += scorer.score_tracks(r.tracks, idx)
+        else:
+            idx += 1
+    return scores
+
+
+def timeit(func, args, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        func(*args)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    recorded = load_recorded()
+    report = {"iterations": args.iterations, "queries": {}}
+    identical = True
+    for query in recorded:
+        results = recorded_results(query, recorded)
+        tracks = [t for r in results if isinstance(r, (MusicPlaylist, MusicArtist))
+                  for t in r.tracks]
+        records = [to_record(r) for r in results]
+        params = (query, results, 10, MediaType.MUSIC)
+        batch_params = (query, records, 10, MediaType.MUSIC)
+        old = legacy_scores(*params) + legacy_track_scores(*params)
+        new = batch_scores(*batch_params) + batch_track_scores(*batch_params)
+        identical = identical and old == new
+        report["queries"][query] = {
+            "results": len(results),
+            "tracks": len(tracks),
+            "identical_scores": old == new,
+            "legacy_us": timeit(legacy_scores, params, args.iterations),
+            "batch_us": timeit(batch_scores, batch_params, args.iterations),
+            "legacy_with_tracks_us": timeit(lambda *a: (legacy_scores(*a),
+                                                        legacy_track_scores(*a)),
+                                            params, args.iterations),
+            "batch_with_tracks_us": timeit(lambda *a: (batch_scores(*a),
+                                                       batch_track_scores(*a)),
+                                           batch_params, args.iterations),
+        }
+    print(json.dumps(report, indent=2))
+    if not identical:
+        sys.exit("batch scores differ from calc_score")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""end to end benchmark of YoutubeMusicSkill.search_youtube_music
+
+runs fully offline: the skill is loaded on a FakeBus and youtube music is
+replaced by FakeYTMusic replaying benchmarks/data/recorded_searches.json
+
+    python benchmarks/bench_search.py [-n ITERATIONS] [--latency S]
+                                      [--expand-latency S] [--output FILE]
+
+scenarios clear the search cache before every timed run except "cached",
+local answers from previously seen results are only enabled in the
+"local_answers" scenario
+
+every scenario reports, per recorded query:
+    time to first result and total time (mean/p50/p95, milliseconds)
+    throughput (searches per second, one search at a time)
+    peak traced memory and memory still held after the search (bytes)
+    memory blocks allocated during the search and not freed by its end
+    (sys.getallocatedblocks delta, garbage not collected yet included)
+    upstream calls per search
+
+the report is printed as json, or written to --output
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# keep the benchmark away from the real cache/config folders
+_TMP = tempfile.mkdtemp(prefix="ytmus-bench-")
+for _var in ("XDG_CACHE_HOME", "XDG_CONFIG_HOME", "XDG_DATA_HOME"):
+    os.environ[_var] = os.path.join(_TMP, _var.lower())
+
+from json_database import JsonStorage
+from ovos_utils.fakebus import FakeBus
+from ovos_utils.ocp import MediaType
+
+from fake_ytmusic import FakeYTMusic
+from recorded import import_skill, load_recorded
+
+SCENARIOS = {
+    # name: (skill settings, warm cache)
+    # the local catalog keeps every result of the first run, local answers
+    # are off unless measured on their own
+    "sequential": ({"stream_search": False, "lazy_playlists": False,
+                    "local_answers": False}, False),
+    "streaming": ({"stream_search": True, "lazy_playlists": False,
+                   "local_answers": False}, False),
+    "lazy": ({"stream_search": True, "lazy_playlists": True,
+              "local_answers": False}, False),
+    "cached": ({"lazy_playlists": False, "local_answers": False}, True),
+    # results seen before are answered from the catalog while youtube searches
+    "local_answers": ({"stream_search": True, "lazy_playlists": True,
+                       "local_answers": True}, False),
+}
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+def summarize(values):
+    return {"mean": statistics.mean(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95)}
+
+
+def make_skill(fake: FakeYTMusic):
+    skill_module = import_skill()
+    skill_module.search_backend._YTMUS = fake
+    # the skill imports tutubo on first use, patch it at the source
+    import tutubo.ytmus
+    tutubo.ytmus.search_yt_music = fake.search_yt_music
+    # only youtube music is faked, thumbnails and streams would hit the network
+    settings = JsonStorage(os.path.join(_TMP, "settings.json"))
+    settings.merge({"artwork_cache": False, "stream_prefetch": False,
+                    "warm_up": False})
+    return skill_module.YoutubeMusicSkill(bus=FakeBus(), skill_id="bench.ytmus",
+                                          settings=settings)
+
+
+def run_query(skill, query):
+    start = time.perf_counter()
+    first = None
+    n = 0
+    for _ in skill.search_youtube_music(query, MediaType.MUSIC):
+        if first is None:
+            first = time.perf_counter() - start
+        n += 1
+    return first or 0.0, time.perf_counter() - start, n
+
+
+def bench(skill, fake, query, iterations, warm):
+    # first run also waits for imports and background loading on skill init
+    run_query(skill, query)
+    ttfr, totals, peaks, retained, blocks, calls = [], [], [], [], [], []
+    n_results = 0
+    for _ in range(iterations):
+        if not warm:
+            skill.search_cache.clear()
+        fake.calls.clear()
+        gc.collect()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        blocks_before = sys.getallocatedblocks()
+        first, total, n_results = run_query(skill, query)
+        blocks.append(sys.getallocatedblocks() - blocks_before)
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        ttfr.append(first * 1000)
+        totals.append(total * 1000)
+        peaks.append(peak - before)
+        retained.append(after - before)
+        calls.append(len(fake.calls))
+    return {"results": n_results,
+            "time_to_first_result_ms": summarize(ttfr),
+            "total_ms": summarize(totals),
+            "throughput_qps": 1000 / statistics.mean(totals),
+            "peak_memory_bytes": int(statistics.mean(peaks)),
+            "retained_memory_bytes": int(statistics.mean(retained)),
+            "allocated_blocks": int(statistics.mean(blocks)),
+            "upstream_calls": statistics.mean(calls)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--iterations", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.3,
+                        help="seconds per fake search request")
+    parser.add_argument("--expand-latency", type=float, default=0.2,
+                        help="seconds per fake album/artist/playlist request")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS),
+                        help="run only these scenarios")
+    parser.add_argument("--output", help="write the json report to this file")
+    args = parser.parse_args()
+
+    recorded = load_recorded()
+    fake = FakeYTMusic(recorded, latency=args.latency,
+                       expand_latency=args.expand_latency, jitter=args.jitter)
+    skill = make_skill(fake)
+
+    report = {"meta": {"python": platform.python_version(),
+                       "platform": platform.platform(),
+                       "iterations": args.iterations,
+                       "latency": args.latency,
+                       "expand_latency": args.expand_latency,
+                       "jitter": args.jitter,
+                       "timestamp": time.time()},
+              "scenarios": {}}
+    for name in args.scenario or SCENARIOS:
+        settings, warm = SCENARIOS[name]
+        skill.settings.merge(settings)
+        report["scenarios"][name] = {
+            query: bench(skill, fake, query, args.iterations, warm)
+            for query in recorded}
+    skill.shutdown()
+
+    out = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(out)
+    else:
+        print(out)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""skill startup benchmark
+
+    python benchmarks/bench_startup.py [-n RUNS] [--cache-entries N] [--output FILE]
+
+every run starts a fresh interpreter that imports the skill and loads it
+on a FakeBus, without network, with a search cache of N entries made of
+the recorded searches already on disk, and reports:
+    ovos framework import time (the skill loader pays this once for all skills)
+    skill import time
+    time from creating the skill to the OCP announce message and to ready
+    which search dependencies were imported by the time the skill was ready,
+    measured with the background warm up disabled
+    time the warm up takes to import them, run right after loading
+    first search against the offline FakeYTMusic, after the warm up
+
+the report is printed as json, or written to --output
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from importlib import import_module
+
+# rapidfuzz and ovos_utils.parse are left out, ovos_workshop imports them
+HEAVY = ("tutubo.ytmus", "ytmusicapi")
+
+
+def seed_cache(path: str, entries: int):
+    """ write `entries` cached searches of recorded results to `path` """
+    from recorded import import_skill, load_recorded, recorded_results
+    skill_module = import_skill()
+    recorded = load_recorded()
+    results = [[skill_module.records.to_record(r) for r in recorded_results(q, recorded)]
+               for q in recorded]
+    cache = skill_module.search_cache.SearchCache(max_disk_entries=entries, path=path)
+    for i in range(entries):
+        cache.put(f"search {i}", results[i % len(results)])
+    cache.flush()
+
+
+def child(seed: str):
+    tmp = tempfile.mkdtemp(prefix="ytmus-bench-")
+    for var in ("XDG_CACHE_HOME", "XDG_CONFIG_HOME", "XDG_DATA_HOME"):
+        os.environ[var] = os.path.join(tmp, var.lower())
+    shutil.copytree(seed, os.path.join(tmp, "xdg_cache_home", "OCP", "Youtube"))
+
+    start = time.perf_counter()
+    import_module("ovos_workshop.skills.common_play")
+    from ovos_utils.fakebus import FakeBus
+    from ovos_utils.ocp import MediaType
+    framework = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from recorded import import_skill
+    skill_module = import_skill()
+    skill_import = time.perf_counter() - start
+
+    from json_database import JsonStorage
+    settings = JsonStorage(os.path.join(tmp, "settings.json"))
+    # no thumbnails or streams from the network, the warm up is run below
+    settings.update({"artwork_cache": False, "stream_prefetch": False,
+                     "warm_up": False})
+    bus = FakeBus()
+    announced = []
+    bus.on("ovos.common_play.announce",
+           lambda m: announced.append(time.perf_counter()))
+    start = time.perf_counter()
+    skill = skill_module.YoutubeMusicSkill(bus=bus, skill_id="bench.ytmus",
+                                          settings=settings)
+    ready = time.perf_counter() - start
+    loaded = [m for m in HEAVY if m in sys.modules]
+
+    warm_up_start = time.perf_counter()
+    skill._warm_up()
+    warm_up = time.perf_counter() - warm_up_start
+
+    from fake_ytmusic import FakeYTMusic
+    skill_module.search_backend._YTMUS = FakeYTMusic(latency=0, expand_latency=0)
+    search_start = time.perf_counter()
+    list(skill.search_youtube_music("zz top", MediaType.MUSIC))
+    first_search = time.perf_counter() - search_start
+    skill.shutdown()
+
+    return {"framework_import_ms": framework * 1000,
+            "skill_import_ms": skill_import * 1000,
+            "time_to_announce_ms": (announced[0] - start) * 1000 if announced else None,
+            "time_to_ready_ms": ready * 1000,
+            "import_plus_ready_ms": (skill_import + ready) * 1000,
+            "warm_up_ms": warm_up * 1000,
+            "first_search_ms": first_search * 1000,
+            "imported_at_ready": loaded}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--runs", type=int, default=10)
+    parser.add_argument("--cache-entries", type=int, default=500,
+                        help="cached searches on disk when the skill loads")
+    parser.add_argument("--output", help="write the json report to this file")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = child(args.child)
+        # the skill logs to stdout, the result is the last line
+        print("\n" + json.dumps(result))
+        return
+
+    seed = tempfile.mkdtemp(prefix="ytmus-bench-cache-")
+    seed_cache(seed, args.cache_entries)
+    runs = []
+    for _ in range(args.runs):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", seed],
+                             capture_output=True, text=True, check=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    shutil.rmtree(seed)
+
+    report = {"runs": args.runs, "cache_entries": args.cache_entries,
+              "imported_at_ready": runs[-1]["imported_at_ready"]}
+    for metric in runs[0]:
+        values = [r[metric] for r in runs if isinstance(r[metric], float)]
+        if values:
+            report[metric] = {"mean": statistics.mean(values),
+                              "p50": statistics.median(values)}
+    out = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(out)
+    else:
+        print(out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""offline stand-in for youtube music, replays the recorded responses in
+data/recorded_searches.json with configurable latency"""
+import json
+import random
+import time
+
+from recorded import load_recorded, recorded_results
+
+
+def _decode(data):
+    """ fresh copy of a recorded response, like json decoded from http """
+    return json.loads(json.dumps(data))
+
+
+class FakeYTMusic:
+    """ replaces ytmusicapi.YTMusic, see search_backend.get_ytmusic """
+
+    def __init__(self, recorded: dict = None, latency: float = 0.3,
+                 expand_latency: float = 0.2, jitter: float = 0.0):
+        self.recorded = recorded or load_recorded()
+        self.latency = latency
+        self.expand_latency = expand_latency
+        self.jitter = jitter
+        self.calls = []
+        self._browse = {}
+        for data in self.recorded.values():
+            self._browse.update(data["browse"])
+
+    def _sleep(self, seconds: float):
+        seconds += random.uniform(0, self.jitter)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def search(self, query: str, *args, **kwargs) -> list:
+        self.calls.append(("search", query))
+        self._sleep(self.latency)
+        data = self.recorded.get(query.strip().lower(), {"search": []})
+        return _decode(data["search"])
+
+    def _get(self, kind: str, browse_id: str) -> dict:
+        self.calls.append((kind, browse_id))
+        self._sleep(self.expand_latency)
+        return _decode(self._browse[browse_id])
+
+    def get_album(self, browse_id: str) -> dict:
+        return self._get("album", browse_id)
+
+    def get_playlist(self, browse_id: str, *args, **kwargs) -> dict:
+        return self._get("playlist", browse_id)
+
+    def get_artist(self, browse_id: str) -> dict:
+        return self._get("artist", browse_id)
+
+    def search_yt_music(self, query: str, as_dict: bool = True, n_retries: int = 3):
+        """ replaces tutubo.ytmus.search_yt_music, expands results one by one """
+        self.calls.append(("search", query))
+        self._sleep(self.latency)
+        query = query.strip().lower()
+        if query not in self.recorded:
+            return
+        for r in recorded_results(query, {query: _decode(self.recorded[query])}):
+            if r._raw_data["resultType"] in ("album", "playlist", "artist"):
+                self.calls.append((r._raw_data["resultType"], r._raw_data.get("browseId")))
+                self._sleep(self.expand_latency)
+            yield r.as_dict if as_dict else r
@@ -0,0 +1,41 @@
+"""helpers shared by the benchmarks, load the skill from this checkout
+and the recorded youtube music responses in data/"""
+import importlib.util
+import json
+import sys
+from os.path import abspath, dirname, join
+
+REPO = dirname(dirname(abspath(__file__)))
+RECORDED = join(dirname(abspath(__file__)), "data", "recorded_searches.json")
+
+
+def import_skill():
+    """ import the skill package from the repo root without installing it """
+    name = "skill_ovos_youtube_music"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            name, join(REPO, "__init__.py"), submodule_search_locations=[REPO])
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+def load_recorded(path: str = RECORDED) -> dict:
+    """ {query: {"search": [raw search results], "browse": {browseId: raw}}} """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def recorded_results(query: str, recorded: dict = None) -> list:
+    """ tutubo objects for a recorded query, as search_yt_music returns them """
+    from tutubo.ytmus import MusicAlbum, MusicArtist, MusicPlaylist, MusicTrack, MusicVideo
+    recorded = recorded or load_recorded()
+    clazzes = {"song": MusicTrack, "video": MusicVideo, "album": MusicAlbum,
+               "playlist": MusicPlaylist, "artist": MusicArtist}
+    results = []
+    for r in recorded[query]["search"]:
+        r = dict(r)
+        r.update(recorded[query]["browse"].get(r.get("browseId"), {}))
+        results.append(clazzes[r["resultType"]](r))
+    return results
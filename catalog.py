@@ -0,0 +1,135 @@
+import csv
+import heapq
+from collections import OrderedDict, defaultdict
+from threading import Lock
+from typing import Iterable, List, NamedTuple, Optional
+
+from ovos_utils.log import LOG
+from .records import ContainerRecord, Record
+from .search_cache import SearchCache
+
+
+class CatalogMatch(NamedTuple):
+    score: float
+    label: str
+    name: str
+    result: Optional[Record]
+
+
+def trigrams(text: str) -> set:
+    text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class LocalCatalog:
+    """ offline index of known artists, songs and playlists
+
+    names come from the bundled youtube.csv and from previously seen
+    search results, lookups use a trigram inverted index and score
+    candidates with the dice coefficient of their trigram sets
+
+    entries from search results keep the result object so they can be
+    played when youtube can not be reached, at most `max_entries` of them
+    are kept, least recently seen are dropped first
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._names = {}  # idx -> (label, name, trigram count)
+        self._results = {}
+        self._ids = {}
+        self._index = defaultdict(set)
+        self._static = set()  # idx of youtube.csv entries, never dropped
+        self._seen = OrderedDict()  # idx of search result entries, LRU order
+        self._next_idx = 0
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._names)
+
+    def add(self, label: str, name: str, result: Optional[Record] = None):
+        """ add a name seen in a search result """
+        self._add(label, name, result, static=False)
+
+    def _add(self, label: str, name: str, result: Optional[Record], static: bool):
+        if not name:
+            return
+        norm = SearchCache.normalize(name)
+        with self._lock:
+            idx = self._ids.get((label, norm))
+            if idx is None:
+                idx = self._next_idx
+                self._next_idx += 1
+                grams = trigrams(norm)
+                self._ids[(label, norm)] = idx
+                self._names[idx] = (label, name, len(grams))
+                for g in grams:
+                    self._index[g].add(idx)
+            if result is not None:
+                self._results[idx] = result
+            if static:
+                self._static.add(idx)
+            else:
+                self._seen[idx] = None
+                self._seen.move_to_end(idx)
+                while len(self._seen) > self.max_entries:
+                    self._drop(self._seen.popitem(last=False)[0])
+
+    def _drop(self, idx: int):
+        self._results.pop(idx, None)
+        if idx in self._static:
+            return
+        label, name, _ = self._names.pop(idx)
+        norm = SearchCache.normalize(name)
+        self._ids.pop((label, norm), None)
+        for g in trigrams(norm):
+            entries = self._index.get(g)
+            if entries is not None:
+                entries.discard(idx)
+                if not entries:
+                    del self._index[g]
+
+    def load_csv(self, path: str):
+        """ load a label,sample csv file such as youtube.csv """
+        with open(path, encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)  # header
+            for label, *sample in reader:
+                # samples are not quoted and may contain commas
+                self._add(label, ",".join(sample).strip(), None, static=True)
+        LOG.debug(f"local catalog loaded {path}, {len(self)} entries")
+
+    def add_results(self, results: Iterable[Record]):
+        for r in results:
+            if r.kind == "artist":
+                self.add("artist_name", r.title, r)
+            elif r.kind == "album":
+                self.add("album_name", r.title, r)
+            elif r.kind == "playlist":
+                self.add("playlist_name", r.title, r)
+            else:
+                self.add("song_name", r.title, r)
+            if isinstance(r, ContainerRecord):
+                for t in r.tracks or ():
+                    self.add("song_name", t.title, t)
+            elif r.artist:
+                self.add("artist_name", r.artist)
+
+    def search(self, phrase: str, limit: int = 10,
+               min_score: float = 0.5) -> List[CatalogMatch]:
+        grams = trigrams(SearchCache.normalize(phrase))
+        if not grams:
+            return []
+        counts = defaultdict(int)
+        with self._lock:
+            for g in grams:
+                for idx in self._index.get(g, ()):
+                    counts[idx] += 1
+            matches = []
+            for idx, common in counts.items():
+                label, name, n_grams = self._names[idx]
+                score = 2 * common / (len(grams) + n_grams)
+                if score >= min_score:
+                    matches.append(CatalogMatch(score, label, name,
+                                                self._results.get(idx)))
+        return heapq.nlargest(limit, matches, key=lambda m: m.score)
@@ -0,0 +1,104 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Iterable, List, Optional
+
+from ovos_utils.log import LOG
+from ovos_utils.parse import fuzzy_match, MatchStrategy
+
+from .search_cache import SearchCache
+
+
+class FeaturedPrefetcher:
+    """ resolves the "featured" queries from skill settings in the background
+
+    queries run in a small thread pool, upstream calls are rate limited
+    with some random jitter so a long featured list does not hammer youtube
+
+    resolved results are indexed by normalized query and can be looked up
+    with fuzzy matching before going to the network
+
+    `search` may answer from a cache, `refresh` is used for periodic
+    refreshes and must always fetch new results
+    """
+
+    def __init__(self, search: Callable[[str], Iterable],
+                 refresh: Optional[Callable[[str], Iterable]] = None,
+                 max_workers: int = 2,
+                 min_interval: float = 1.0,
+                 jitter: float = 0.5):
+        self.search = search
+        self.refresh = refresh or search
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="ytmus-featured")
+        self._index = {}
+        self._queries = []
+        self._pending = set()
+        self._lock = Lock()
+        self._throttle_lock = Lock()
+        self._last_call = 0
+
+    def start(self, queries: List[str], refresh: bool = False):
+        """ schedule all queries, returns immediately """
+        self._queries = [SearchCache.normalize(q) for q in queries]
+        for query in self._queries:
+            with self._lock:
+                if query in self._pending:
+                    continue
+                self._pending.add(query)
+            self._pool.submit(self._fetch, query,
+                              self.refresh if refresh else self.search)
+
+    def _throttle(self):
+        with self._throttle_lock:
+            wait = self._last_call + self.min_interval - time.monotonic()
+            wait += random.uniform(0, self.jitter)
+            if wait > 0:
+                time.sleep(wait)
+            self._last_call = time.monotonic()
+
+    def _fetch(self, query: str, search: Callable[[str], Iterable]):
+        try:
+            self._throttle()
+            results = list(search(query))
+            n_tracks = sum(len(r.tracks) for r in results
+                           if getattr(r, "tracks", None))
+            with self._lock:
+                self._index[query] = results
+            LOG.debug(f"prefetched featured query '{query}': "
+                      f"{len(results)} results, {n_tracks} tracks")
+        except Exception as e:
+            LOG.error(f"failed to prefetch featured query '{query}': {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(query)
+
+    def lookup(self, phrase: str, threshold: float = 0.9) -> Optional[list]:
+        """ return prefetched results for the best matching featured query """
+        phrase = SearchCache.normalize(phrase)
+        with self._lock:
+            index = dict(self._index)
+        if phrase in index:
+            return list(index[phrase])
+        best, best_score = None, threshold
+        for query in index:
+            score = fuzzy_match(phrase, query,
+                                strategy=MatchStrategy.DAMERAU_LEVENSHTEIN_SIMILARITY)
+            if score >= best_score:
+                best, best_score = query, score
+        if best is None:
+            return None
+        return list(index[best])
+
+    @property
+    def results(self) -> list:
+        """ prefetched results, in the order of the featured setting """
+        with self._lock:
+            return [r for q in self._queries
+                    for r in self._index.get(q, [])]
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple
+
+from ovos_utils.log import LOG
+from .records import ContainerRecord, TrackRecord
+from .search_backend import expand
+
+LAZY_URI = "ytmus//"
+
+
+def lazy_uri(result: ContainerRecord) -> str:
+    """ handle for an album/artist/playlist, resolved into tracks at playback """
+    return f"{LAZY_URI}{result.kind}/{result.browse_id}"
+
+
+class PlaylistResolver:
+    """ expands lazy album/artist/playlist handles into tracks on demand
+
+    search results that already carry their tracks can be registered with
+    `seed`, resolved track lists are kept in a small LRU
+    """
+
+    def __init__(self, max_entries: int = 20):
+        self.max_entries = max_entries
+        self._containers = OrderedDict()
+        self._lock = Lock()
+
+    def _remember(self, uri: str, container: ContainerRecord):
+        with self._lock:
+            self._containers[uri] = container
+            self._containers.move_to_end(uri)
+            while len(self._containers) > self.max_entries:
+                self._containers.popitem(last=False)
+
+    def seed(self, uri: str, container: ContainerRecord):
+        if container.expanded:
+            self._remember(uri, container)
+
+    def resolve(self, uri: str) -> Tuple[TrackRecord, ...]:
+        with self._lock:
+            container: Optional[ContainerRecord] = self._containers.get(uri)
+        if container is None:
+            if not uri.startswith(LAZY_URI):
+                return ()
+            result_type, browse_id = uri[len(LAZY_URI):].split("/", 1)
+            try:
+                container = expand({"resultType": result_type,
+                                    "browseId": browse_id})
+            except Exception as e:
+                LOG.error(f"failed to resolve {uri}: {e}")
+                return ()
+            self._remember(uri, container)
+        return container.tracks
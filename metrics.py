@@ -0,0 +1,220 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from threading import Lock
+from typing import Iterable, Optional
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+_NULL_SPAN = nullcontext()
+
+
+class Histogram:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.sum += value
+        self.count += 1
+        for i, b in enumerate(self.buckets):
+            if value <= b:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    @property
+    def as_dict(self) -> dict:
+        return {"buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"],
+                                    self.counts)),
+                "sum": self.sum,
+                "count": self.count}
+
+    def prometheus(self, name: str, labels: str = "") -> list:
+        lines = []
+        cumulative = 0
+        sep = "," if labels else ""
+        for b, c in zip(list(self.buckets) + ["+Inf"], self.counts):
+            cumulative += c
+            lines.append(f'{name}_bucket{{{labels}{sep}le="{b}"}} {cumulative}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {self.sum}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+class QueryTrace:
+    """ timings and counters of a single search """
+
+    def __init__(self, metrics: "SearchMetrics"):
+        self.metrics = metrics
+        self.start = time.perf_counter()
+        self.stages = defaultdict(float)
+        self.counters = defaultdict(int)
+        self.first_yield = None
+        self.total = None
+
+    def add(self, stage: str, seconds: float):
+        self.stages[stage] += seconds
+
+    def count(self, counter: str, n: int = 1):
+        self.counters[counter] += n
+
+    @contextmanager
+    def span(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def timed(self, stage: str, iterable: Iterable):
+        """ iterate while adding the time spent waiting for items to `stage` """
+        it = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+            finally:
+                self.add(stage, time.perf_counter() - start)
+            yield item
+
+    def mark_yield(self):
+        if self.first_yield is None:
+            self.first_yield = time.perf_counter() - self.start
+
+    def finish(self):
+        self.total = time.perf_counter() - self.start
+        self.metrics.record(self)
+
+    @property
+    def as_dict(self) -> dict:
+        return {"stages": dict(self.stages),
+                "counters": dict(self.counters),
+                "time_to_first_yield": self.first_yield,
+                "total": self.total}
+
+
+class _NullTrace:
+    """ stand in for QueryTrace when metrics are disabled """
+
+    def add(self, stage, seconds):
+        pass
+
+    def count(self, counter, n=1):
+        pass
+
+    def span(self, stage):
+        return _NULL_SPAN
+
+    def timed(self, stage, iterable):
+        return iterable
+
+    def mark_yield(self):
+        pass
+
+    def finish(self):
+        pass
+
+
+NULL_TRACE = _NullTrace()
+
+
+class SearchMetrics:
+    """ aggregates QueryTraces into counters and latency histograms
+
+    per stage timings, time to first yielded result and total search time
+    are exported as histograms, either as a dict or in prometheus text format
+    """
+
+    def __init__(self, enabled: bool = False, prefix: str = "ytmus"):
+        self.enabled = enabled
+        self.prefix = prefix
+        self.queries = 0
+        self.counters = defaultdict(int)
+        self.stages = defaultdict(Histogram)
+        self.first_yield = Histogram()
+        self.total = Histogram()
+        self.last_query: Optional[dict] = None
+        self._lock = Lock()
+
+    def start_query(self):
+        if not self.enabled:
+            return NULL_TRACE
+        return QueryTrace(self)
+
+    def observe(self, stage: str, seconds: float):
+        """ record a stage that runs outside of a search, eg. at playback """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.stages[stage].observe(seconds)
+
+    def span(self, stage: str):
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(stage)
+
+    @contextmanager
+    def _span(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def record(self, trace: QueryTrace):
+        with self._lock:
+            self.queries += 1
+            for stage, seconds in trace.stages.items():
+                self.stages[stage].observe(seconds)
+            for counter, n in trace.counters.items():
+                self.counters[counter] += n
+            if trace.first_yield is not None:
+                self.first_yield.observe(trace.first_yield)
+            self.total.observe(trace.total)
+            self.last_query = trace.as_dict
+
+    @property
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {"enabled": self.enabled,
+                    "queries": self.queries,
+                    "counters": dict(self.counters),
+                    "stages": {k: v.as_dict for k, v in self.stages.items()},
+                    "time_to_first_yield": self.first_yield.as_dict,
+                    "total": self.total.as_dict,
+                    "last_query": self.last_query}
+
+    def prometheus(self) -> str:
+        p = self.prefix
+        with self._lock:
+            lines = [f"# TYPE {p}_queries_total counter",
+                     f"{p}_queries_total {self.queries}"]
+            for counter, n in sorted(self.counters.items()):
+                lines += [f"# TYPE {p}_{counter}_total counter",
+                          f"{p}_{counter}_total {n}"]
+            lines.append(f"# TYPE {p}_stage_seconds histogram")
+            for stage, hist in sorted(self.stages.items()):
+                lines += hist.prometheus(f"{p}_stage_seconds", f'stage="{stage}"')
+            lines.append(f"# TYPE {p}_time_to_first_result_seconds histogram")
+            lines += self.first_yield.prometheus(f"{p}_time_to_first_result_seconds")
+            lines.append(f"# TYPE {p}_search_seconds histogram")
+            lines += self.total.prometheus(f"{p}_search_seconds")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> str:
+        """ one line summary for the logs """
+        with self._lock:
+            if not self.queries:
+                return "no searches"
+            stages = ", ".join(f"{k}={v.sum / v.count * 1000:.1f}ms"
+                               for k, v in sorted(self.stages.items()))
+            ttfy = (self.first_yield.sum / self.first_yield.count * 1000
+                    if self.first_yield.count else 0)
+            return (f"{self.queries} searches, "
+                    f"avg total={self.total.sum / self.total.count * 1000:.1f}ms, "
+                    f"avg first result={ttfy:.1f}ms, {stages}")
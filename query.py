@@ -0,0 +1,57 @@
+import re
+from typing import Callable, Dict, List, NamedTuple, Optional, Pattern
+
+from ovos_utils.log import LOG
+
+from .search_cache import SearchCache
+
+
+class ParsedQuery(NamedTuple):
+    phrase: str  # search phrase without the provider keyword
+    key: str  # normalized phrase, used for caching and scoring
+    explicit: bool  # the user asked for youtube
+
+
+class QueryParser:
+    """ detects and strips the youtube keyword from search phrases
+
+    every alternative of the `vocs` vocabulary files of a language is
+    compiled once into a single word bounded regex, longest first so
+    "youtube music" is removed as a whole, matching and stripping then
+    take a single pass over the phrase
+
+    `voc_list(voc_filename, lang)` loads the vocabulary, usually the
+    skill's voc_list method
+    """
+
+    def __init__(self, voc_list: Callable[[str, str], List[str]],
+                 vocs: tuple = ("youtube_music_skill", "youtube")):
+        self.voc_list = voc_list
+        self.vocs = vocs
+        self._patterns: Dict[str, Optional[Pattern]] = {}
+
+    def compile(self, lang: str) -> Optional[Pattern]:
+        if lang in self._patterns:
+            return self._patterns[lang]
+        words = set()
+        for voc in self.vocs:
+            try:
+                words.update(w.strip() for w in self.voc_list(voc, lang))
+            except FileNotFoundError:
+                LOG.warning(f"missing {voc}.voc for '{lang}'")
+        words.discard("")
+        pattern = None
+        if words:
+            alternatives = sorted(words, key=len, reverse=True)
+            pattern = re.compile(r"\b(?:" + "|".join(re.escape(w) for w in alternatives) + r")\b",
+                                 re.IGNORECASE)
+        self._patterns[lang] = pattern
+        return pattern
+
+    def parse(self, phrase: str, lang: str) -> ParsedQuery:
+        pattern = self.compile(lang)
+        n = 0
+        if pattern is not None:
+            phrase, n = pattern.subn("", phrase)
+        phrase = " ".join(phrase.split())
+        return ParsedQuery(phrase, SearchCache.normalize(phrase), n > 0)
@@ -0,0 +1,162 @@
+from sys import intern
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+from ovos_utils.ocp import MediaEntry, MediaType, PlaybackType
+
+if TYPE_CHECKING:
+    from tutubo.ytmus import YTMusicResult
+
+
+def _intern(s: Optional[str]) -> str:
+    # artists and thumbnails repeat across results and album tracks
+    return intern(s) if s else ""
+
+
+class TrackRecord:
+    """ compact song/video search result """
+    __slots__ = ("video_id", "title", "artist", "length", "image", "is_video")
+
+    def __init__(self, video_id: str, title: str, artist: str = "",
+                 length: int = 0, image: str = "", is_video: bool = False):
+        self.video_id = video_id
+        self.title = title or ""
+        self.artist = _intern(artist)
+        self.length = length or 0
+        self.image = _intern(image)
+        self.is_video = is_video
+
+    @property
+    def kind(self) -> str:
+        return "video" if self.is_video else "song"
+
+    @property
+    def watch_url(self) -> str:
+        if not self.video_id:
+            return ""
+        if self.is_video:
+            return f"https://www.youtube.com/watch?v={self.video_id}"
+        return f"https://music.youtube.com/watch?v={self.video_id}"
+
+    @classmethod
+    def from_result(cls, track: "YTMusicResult") -> "TrackRecord":
+        from tutubo.ytmus import MusicVideo
+        return cls(track.video_id, track.title, track.artist, track.length,
+                   track.thumbnail_url, is_video=isinstance(track, MusicVideo))
+
+    def to_media_entry(self, score: float = 0, **header) -> MediaEntry:
+        """ header: skill_id/skill_icon shared by every entry of the skill """
+        return MediaEntry(uri=self.watch_url,
+                          match_confidence=score,
+                          playback=PlaybackType.AUDIO,
+                          media_type=MediaType.VIDEO if self.is_video else MediaType.MUSIC,
+                          length=self.length * 1000,
+                          image=self.image,
+                          title=self.title,
+                          artist=self.artist,
+                          **header)
+
+    def as_list(self) -> list:
+        return [self.video_id, self.title, self.artist, self.length,
+                self.image, self.is_video]
+
+    @classmethod
+    def from_list(cls, data: list) -> "TrackRecord":
+        video_id, title, artist, length, image, is_video = data
+        return cls(video_id, title, artist, length, image, is_video)
+
+
+def _count(value) -> int:
+    """ youtube music item counts are strings such as "1,234" """
+    digits = "".join(c for c in str(value or "") if c.isdigit())
+    return int(digits) if digits else 0
+
+
+class ContainerRecord:
+    """ compact album/artist/playlist search result
+
+    `tracks` is None until the container is expanded, `track_count` is the
+    number of tracks, 0 if youtube did not say before expansion
+    """
+    __slots__ = ("kind", "browse_id", "title", "artist", "image", "tracks",
+                 "track_count")
+
+    def __init__(self, kind: str, browse_id: str, title: str, artist: str = "",
+                 image: str = "", tracks: Optional[Tuple[TrackRecord, ...]] = None,
+                 track_count: int = 0):
+        self.kind = intern(kind)
+        self.browse_id = browse_id
+        self.title = title or ""
+        self.artist = _intern(artist)
+        self.image = _intern(image)
+        self.tracks = tracks
+        self.track_count = len(tracks) if tracks is not None else track_count
+
+    @property
+    def expanded(self) -> bool:
+        return self.tracks is not None
+
+    @classmethod
+    def from_result(cls, result: "YTMusicResult", expanded: bool = True) -> "ContainerRecord":
+        from tutubo.ytmus import MusicAlbum, MusicArtist
+        raw = result._raw_data
+        if isinstance(result, MusicArtist):
+            kind = "artist"
+        elif isinstance(result, MusicAlbum):
+            kind = "album"
+        else:
+            kind = "playlist"
+        tracks = None
+        if expanded:
+            tracks = tuple(TrackRecord.from_result(t) for t in result.tracks)
+        return cls(kind, raw.get("browseId", ""), result.title,
+                   result.artist, result.thumbnail_url, tracks,
+                   track_count=_count(raw.get("itemCount")))
+
+    def with_tracks(self, tracks: Tuple[TrackRecord, ...]) -> "ContainerRecord":
+        """ expanded copy of a stub, keeps the search result metadata """
+        return ContainerRecord(self.kind, self.browse_id, self.title,
+                               self.artist, self.image, tracks)
+
+    def as_list(self) -> list:
+        tracks = None
+        if self.tracks is not None:
+            tracks = [t.as_list() for t in self.tracks]
+        return [self.kind, self.browse_id, self.title, self.artist,
+                self.image, tracks, self.track_count]
+
+    @classmethod
+    def from_list(cls, data: list) -> "ContainerRecord":
+        kind, browse_id, title, artist, image, tracks, track_count = data
+        if tracks is not None:
+            tracks = tuple(TrackRecord.from_list(t) for t in tracks)
+        return cls(kind, browse_id, title, artist, image, tracks, track_count)
+
+
+Record = Union[TrackRecord, ContainerRecord]
+
+
+def to_record(result: "YTMusicResult", expanded: bool = True) -> Record:
+    """ convert a tutubo result, `expanded` is False for search results
+    whose tracks were not fetched """
+    from tutubo.ytmus import MusicArtist, MusicPlaylist
+    if isinstance(result, (MusicPlaylist, MusicArtist)):
+        return ContainerRecord.from_result(result, expanded)
+    return TrackRecord.from_result(result)
+
+
+def record_key(record: Record) -> tuple:
+    """ identifies the same result across searches and the local catalog """
+    if isinstance(record, ContainerRecord):
+        return record.kind, record.browse_id
+    return "track", record.video_id
+
+
+def dump_records(records: List[Record]) -> list:
+    """ json serializable form of a result list """
+    return [["c" if isinstance(r, ContainerRecord) else "t", r.as_list()]
+            for r in records]
+
+
+def load_records(data: list) -> List[Record]:
+    return [ContainerRecord.from_list(d) if t == "c" else TrackRecord.from_list(d)
+            for t, d in data]
@@ -0,0 +1,77 @@
+from typing import Iterable, List, Optional
+
+from ovos_utils.ocp import MediaType
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import DamerauLevenshtein
+
+from .records import ContainerRecord, Record, TrackRecord
+
+
+class ResultScorer:
+    """ scores youtube music results against a search phrase
+
+    the phrase is lowercased once and every list of results is matched in a
+    single rapidfuzz call, scores are the same as scoring results one by one:
+
+        base_score - 5 * idx (position in the results)
+        - 10 for music videos
+        + 80 * token set ratio of phrase and artist
+        + 80 * damerau-levenshtein similarity of phrase and title
+        - 10 for GENERIC queries
+    """
+
+    def __init__(self, phrase: str, base_score: float = 0,
+                 media_type: MediaType = MediaType.GENERIC):
+        self.phrase = phrase.lower()
+        self.base_score = base_score
+        self.media_type = media_type
+
+    def _similarities(self, names: List[Optional[str]], scorer) -> List[float]:
+        sims = [0.0] * len(names)
+        choices = {i: n.lower() for i, n in enumerate(names) if n}
+        for _, sim, i in process.extract_iter(self.phrase, choices,
+                                              scorer=scorer, processor=None):
+            sims[i] = sim
+        return sims
+
+    def score_many(self, matches: List[Record],
+                   idxs: List[int]) -> List[float]:
+        artists = self._similarities([m.artist for m in matches],
+                                     fuzz.token_set_ratio)
+        titles = self._similarities([m.title for m in matches],
+                                    DamerauLevenshtein.normalized_similarity)
+        scores = []
+        for match, idx, artist, title in zip(matches, idxs, artists, titles):
+            # idx represents the order from youtube
+            score = self.base_score - idx * 5  # - 5% as we go down the results list
+            if getattr(match, "is_video", False):
+                score -= 10  # penalty for video results
+            if match.artist:
+                score += 80 * (artist / 100)
+            if match.title:
+                score += 80 * title
+            if self.media_type == MediaType.GENERIC:
+                score -= 10
+            scores.append(min(100, score))
+        return scores
+
+    def score(self, match: Record, idx: int = 0) -> float:
+        return self.score_many([match], [idx])[0]
+
+    def score_results(self, results: List[Record]) -> List[float]:
+        """ score a full result list, idx only counts songs/videos
+        like the search handler does """
+        idxs = []
+        idx = 0
+        for r in results:
+            idxs.append(idx)
+            if not isinstance(r, ContainerRecord):
+                idx += 1
+        return self.score_many(results, idxs)
+
+    def score_tracks(self, tracks: Iterable[TrackRecord],
+                     idx: int = 0) -> List[float]:
+        """ score the tracks of an album/artist/playlist individually,
+        tracks share the position of their container """
+        tracks = list(tracks)
+        return self.score_many(tracks, [idx] * len(tracks))
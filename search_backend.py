@@ -0,0 +1,207 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from threading import Event
+from typing import TYPE_CHECKING, Iterator, List, Optional
+
+from ovos_utils.log import LOG
+
+from .metrics import NULL_TRACE
+from .records import ContainerRecord, Record, to_record
+from .search_core import AsyncSearchCore
+
+if TYPE_CHECKING:
+    from tutubo.ytmus import YTMusicResult
+    from ytmusicapi import YTMusic
+
+_YTMUS = None
+_POLL = 0.05  # seconds between checks for search stop/deadline
+
+# tutubo and ytmusicapi are imported on first use, they are slow to import
+# and not needed until the first search
+
+
+class SearchAborted(Exception):
+    """ the search was stopped before every result was returned """
+
+
+def get_ytmusic(max_retries: int = 3) -> "YTMusic":
+    global _YTMUS
+    if _YTMUS is None:
+        from ytmusicapi import YTMusic
+        for i in range(max_retries):
+            try:
+                _YTMUS = YTMusic()
+                break
+            except Exception:
+                time.sleep(0.5 * (i + 1))
+    return _YTMUS
+
+
+def is_expanded(result: Record) -> bool:
+    """ False for albums/artists/playlists whose tracks were not fetched """
+    return not isinstance(result, ContainerRecord) or result.expanded
+
+
+def _stub(r: dict) -> ContainerRecord:
+    return to_record(_wrap(r), expanded=False)
+
+
+def _wrap(r: dict) -> Optional["YTMusicResult"]:
+    from tutubo.ytmus import MusicTrack, MusicVideo, MusicAlbum, MusicPlaylist, MusicArtist
+    if r["resultType"] == "video":
+        return MusicVideo(r)
+    elif r["resultType"] == "song":
+        return MusicTrack(r)
+    elif r["resultType"] == "album":
+        return MusicAlbum(r)
+    elif r["resultType"] == "playlist":
+        return MusicPlaylist(r)
+    elif r["resultType"] == "artist":
+        return MusicArtist(r)
+    return None
+
+
+def expand(r: dict) -> ContainerRecord:
+    """ fetch the tracks of an album/artist/playlist search result """
+    ytmusic = get_ytmusic()
+    if r["resultType"] == "album":
+        r.update(ytmusic.get_album(r["browseId"]))
+    elif r["resultType"] == "playlist":
+        r.update(ytmusic.get_playlist(r.get("browseId", "")))
+    elif r["resultType"] == "artist":
+        r.update(ytmusic.get_artist(r["browseId"]))
+    return to_record(_wrap(r))
+
+
+def expand_records(results: List[Record], core: AsyncSearchCore) -> List[Record]:
+    """ expand the albums/artists/playlists of a result list that were
+    stored without tracks, concurrently through `core`
+
+    containers that fail to expand are kept as stubs
+    """
+    futures = {}
+    for i, r in enumerate(results):
+        if not is_expanded(r):
+            key = ("expand", r.kind, r.browse_id)
+            futures[i] = core.submit(key, expand, {"resultType": r.kind,
+                                                   "browseId": r.browse_id})
+    results = list(results)
+    for i, fut in futures.items():
+        try:
+            results[i] = results[i].with_tracks(fut.result().tracks)
+        except Exception as e:
+            LOG.debug(f"failed to expand {results[i].kind} {results[i].browse_id}: {e}")
+    return results
+
+
+def sequential_search(query: str) -> Iterator[Record]:
+    """ tutubo search, every album/artist/playlist is expanded one after the other """
+    from tutubo.ytmus import search_yt_music
+    for r in search_yt_music(query, as_dict=False):
+        yield to_record(r)
+
+
+def search(query: str) -> list:
+    """ raw youtube music search results, albums/artists/playlists
+    need to be expanded to get their tracks """
+    return get_ytmusic().search(query)
+
+
+def submit_search(query: str, core: AsyncSearchCore) -> Future:
+    """ send the search request through `core` without waiting for it """
+    return core.submit(("search", query), search, query)
+
+
+def stream_search_yt_music(query: str, core: AsyncSearchCore,
+                           timeout: Optional[float] = None,
+                           expand_containers: bool = True,
+                           stop_event: Optional[Event] = None,
+                           search_fut: Optional[Future] = None,
+                           trace=NULL_TRACE) -> Iterator[Record]:
+    """ search youtube music yielding results as soon as they are available
+
+    songs and videos are yielded right away, albums/artists/playlists are
+    expanded concurrently through `core` and yielded as each one finishes
+
+    expansions still running after `timeout` seconds are yielded as stubs
+    without tracks, see `is_expanded`, TimeoutError is raised if youtube
+    did not answer the search itself by then
+
+    `search_fut` is a request already sent with `submit_search`
+
+    the time from the first expansion request until the last one finished
+    is added to the "expand" stage of `trace`
+
+    if `expand_containers` is False albums/artists/playlists are always
+    yielded as stubs, their tracks can be fetched later with `expand`
+
+    setting `stop_event` aborts the search with SearchAborted, pending
+    requests are cancelled
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+
+    def remaining() -> Optional[float]:
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    def aborted() -> bool:
+        return stop_event is not None and stop_event.is_set()
+
+    pending = {}
+    expand_start = None
+    search_fut = search_fut or submit_search(query, core)
+    pending[search_fut] = None
+    try:
+        while not search_fut.done():
+            if aborted():
+                raise SearchAborted(f"search for '{query}' stopped before youtube answered")
+            if remaining() == 0:
+                raise TimeoutError(f"youtube music did not answer '{query}' "
+                                   f"within {timeout}s")
+            wait([search_fut], timeout=_POLL)
+        pending.pop(search_fut)
+
+        for r in search_fut.result():
+            r = dict(r)
+            if r["resultType"] in ("album", "playlist", "artist"):
+                if not expand_containers:
+                    yield _stub(r)
+                    continue
+                key = ("expand", r["resultType"], r.get("browseId"))
+                if expand_start is None:
+                    expand_start = time.perf_counter()
+                pending[core.submit(key, expand, dict(r))] = r
+            else:
+                obj = _wrap(r)
+                if obj is not None:
+                    yield to_record(obj)
+
+        while pending:
+            if aborted():
+                raise SearchAborted(f"search for '{query}' stopped, "
+                                    f"{len(pending)} results not expanded")
+            if remaining() == 0:
+                LOG.debug(f"search deadline reached, {len(pending)} results not expanded")
+                for r in list(pending.values()):
+                    yield _stub(r)
+                return
+            timeout = _POLL if deadline is None else min(_POLL, remaining())
+            done, _ = wait(list(pending), timeout=timeout,
+                           return_when=FIRST_COMPLETED)
+            for fut in done:
+                pending.pop(fut)
+                if fut.cancelled():
+                    continue
+                if fut.exception() is None:
+                    trace.count("containers_expanded")
+                    yield fut.result()
+                else:
+                    trace.count("expand_errors")
+                    LOG.debug(f"failed to expand search result: {fut.exception()}")
+    finally:
+        if expand_start is not None:
+            trace.add("expand", time.perf_counter() - expand_start)
+        # search aborted or finished, drop requests nobody will read
+        for fut in pending:
+            fut.cancel()
@@ -0,0 +1,278 @@
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from os.path import isdir, join
+from threading import Lock, RLock, Thread, Timer
+from typing import Callable, List, Optional
+
+from ovos_utils.log import LOG
+from ovos_utils.xdg_utils import xdg_cache_home
+
+from .records import dump_records, load_records
+
+
+class SearchCache:
+    """ two tier cache for youtube music search results
+
+    an in-memory LRU sits in front of a folder on disk
+    (~/.cache/OCP/Youtube), entries are keyed by normalized search phrase
+    and every entry is a small json file holding result records as compact
+    lists, only the age of the files on disk is kept in memory
+
+    entries older than `ttl` are stale, stale entries are still returned for
+    another `stale_ttl` seconds while a refresh happens in the background
+
+    new entries are written on a background thread at most once every
+    `store_delay` seconds, searches never wait for it
+    """
+
+    def __init__(self, ttl: float = 24 * 3600,
+                 stale_ttl: float = 7 * 24 * 3600,
+                 max_entries: int = 100,
+                 max_disk_entries: int = 500,
+                 name: str = "Youtube",
+                 store_delay: float = 5,
+                 path: Optional[str] = None):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.store_delay = store_delay
+        self.path = path or join(xdg_cache_home(), "OCP", name)
+        self._mem = OrderedDict()
+        self._files = OrderedDict()  # file name -> timestamp, oldest first
+        self._pending = {}  # file name -> entry not written yet
+        self._store_timer = None
+        self._store_lock = Lock()
+        self._refreshing = set()
+        self._lock = RLock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._loaded = False
+
+    def load(self):
+        """ index the entries on disk, meant to run in a background thread
+
+        the cache can be used meanwhile, entries on disk are read on a miss
+        and evicted once loaded
+        """
+        if os.path.isfile(self.path + ".json"):
+            # single file cache of previous versions
+            os.remove(self.path + ".json")
+        files = []
+        if isdir(self.path):
+            for entry in os.scandir(self.path):
+                if entry.name.endswith(".json"):
+                    files.append((entry.name, entry.stat().st_mtime))
+        with self._lock:
+            # entries put meanwhile are newer than the ones on disk
+            files = dict(files)
+            files.update(self._files)
+            self._files = OrderedDict(sorted(files.items(), key=lambda f: f[1]))
+            self._loaded = True
+        self._evict()
+
+    @staticmethod
+    def normalize(phrase: str) -> str:
+        return " ".join(phrase.lower().split())
+
+    @staticmethod
+    def _name(key: str) -> str:
+        return hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json"
+
+    @property
+    def stats(self) -> dict:
+        return {"hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._mem),
+                "disk_entries": len(self._files)}
+
+    # (de)serialization of result records
+    @staticmethod
+    def _serialize(results: list) -> list:
+        return dump_records(results)
+
+    @staticmethod
+    def _deserialize(results: list) -> Optional[list]:
+        """ None if the entry is not in the current format """
+        try:
+            return load_records(results)
+        except (TypeError, ValueError):
+            return None
+
+    def _read(self, name: str) -> Optional[dict]:
+        entry = self._pending.get(name)
+        if entry is not None:
+            return entry
+        if self._loaded and name not in self._files:
+            return None
+        try:
+            with open(join(self.path, name), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            self._files.pop(name, None)
+        except Exception as e:
+            LOG.error(f"failed to read cached search {name}: {e}")
+            self._drop_disk(name)
+        return None
+
+    def _get_entry(self, key: str) -> Optional[dict]:
+        entry = self._mem.get(key)
+        if entry is not None:
+            self._mem.move_to_end(key)
+            return entry
+        name = self._name(key)
+        entry = self._read(name)
+        if entry is not None:
+            results = self._deserialize(entry.get("results"))
+            if results is None:
+                # unknown format, it is only a cache
+                self._drop_disk(name)
+                return None
+            # promote to memory tier
+            entry = {"ts": entry["ts"], "results": results}
+            self._set_mem(key, entry)
+        return entry
+
+    def _drop_disk(self, name: str):
+        self._files.pop(name, None)
+        self._pending.pop(name, None)
+        try:
+            os.remove(join(self.path, name))
+        except FileNotFoundError:
+            pass
+
+    def _set_mem(self, key: str, entry: dict):
+        self._mem[key] = entry
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str,
+            refresh: Optional[Callable[[], list]] = None,
+            stale: bool = True) -> Optional[list]:
+        """ return cached results or None
+
+        if the entry is stale and a `refresh` callable is provided it is
+        called in a background thread to update the entry, stale entries
+        are a miss if `stale` is False
+        """
+        with self._lock:
+            entry = self._get_entry(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            age = time.time() - entry["ts"]
+            if age > self.ttl + self.stale_ttl:
+                self.misses += 1
+                self._mem.pop(key, None)
+                return None
+            if age > self.ttl and not stale:
+                self.misses += 1
+                return None
+            if age > self.ttl:
+                self.stale_hits += 1
+                if refresh is not None and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    Thread(target=self._refresh, args=(key, refresh),
+                           daemon=True).start()
+            else:
+                self.hits += 1
+            return list(entry["results"])
+
+    def _refresh(self, key: str, refresh: Callable[[], list]):
+        try:
+            self.put(key, refresh())
+        except Exception as e:
+            LOG.error(f"failed to refresh cached search '{key}': {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def put(self, key: str, results: List):
+        if not results:
+            return
+        now = time.time()
+        data = self._serialize(results)
+        name = self._name(key)
+        with self._lock:
+            self._set_mem(key, {"ts": now, "results": list(results)})
+            self._pending[name] = {"key": key, "ts": now, "results": data}
+            self._files[name] = now
+            self._files.move_to_end(name)
+            self._schedule_store()
+
+    def _schedule_store(self):
+        if self._store_timer is None:
+            self._store_timer = Timer(self.store_delay, self.flush)
+            self._store_timer.daemon = True
+            self._store_timer.start()
+
+    def flush(self):
+        """ write pending entries now """
+        with self._store_lock:
+            with self._lock:
+                if self._store_timer is not None:
+                    self._store_timer.cancel()
+                    self._store_timer = None
+                pending = dict(self._pending)
+            for name, entry in pending.items():
+                try:
+                    self._write(name, entry)
+                except Exception as e:
+                    LOG.error(f"failed to save cached search '{entry['key']}': {e}")
+                with self._lock:
+                    # a newer entry may have been put meanwhile
+                    if self._pending.get(name) is entry:
+                        del self._pending[name]
+            self._evict()
+
+    def _write(self, name: str, entry: dict):
+        path = join(self.path, name)
+        os.makedirs(self.path, exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(path + ".tmp", path)
+        # file age is the entry age, restores order on load
+        os.utime(path, (entry["ts"], entry["ts"]))
+
+    def _evict(self):
+        with self._lock:
+            while self._loaded and len(self._files) > self.max_disk_entries:
+                name, _ = self._files.popitem(last=False)
+                self._drop_disk(name)
+                self.evictions += 1
+
+    def iter_results(self):
+        """ iterate over the results of every search stored on disk,
+        only the ones indexed so far if `load` did not run yet """
+        with self._lock:
+            names = list(self._files)
+        for name in names:
+            with self._lock:
+                entry = self._read(name)
+            if entry is None:
+                continue
+            results = self._deserialize(entry.get("results"))
+            if results is not None:
+                yield results
+
+    def clear(self):
+        with self._store_lock, self._lock:
+            if self._store_timer is not None:
+                self._store_timer.cancel()
+                self._store_timer = None
+            self._mem.clear()
+            self._pending.clear()
+            names = set(self._files)
+            if isdir(self.path):
+                names.update(n for n in os.listdir(self.path) if n.endswith(".json"))
+            for name in names:
+                self._drop_disk(name)
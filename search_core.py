@@ -0,0 +1,100 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Thread
+from typing import Callable, Hashable
+
+from ovos_utils.log import LOG
+
+
+class AsyncSearchCore:
+    """ runs blocking upstream youtube music calls from an asyncio loop
+
+    identical requests that are in flight at the same time share a single
+    upstream call (single flight), at most `max_concurrency` upstream calls
+    run at once and each one is given up after `timeout` seconds, an
+    abandoned call still counts against the limit until its thread returns
+
+    callers get a concurrent.futures.Future, cancelling it detaches that
+    caller, the upstream call is only cancelled once nobody waits for it
+    """
+
+    def __init__(self, max_concurrency: int = 4, timeout: float = 10):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix="ytmus-search")
+        self._inflight = {}  # key -> [task, n_waiters]
+        self._semaphore = None
+        self.upstream_calls = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self.loop.run_forever, daemon=True,
+                              name="ytmus-search-loop")
+        self._thread.start()
+
+    @property
+    def stats(self) -> dict:
+        return {"upstream_calls": self.upstream_calls,
+                "coalesced": self.coalesced,
+                "timeouts": self.timeouts,
+                "in_flight": len(self._inflight)}
+
+    async def _call(self, func: Callable, *args):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # a slot is only given back once its worker thread is free again,
+        # calls never queue inside the executor so the timeout starts when
+        # the call does, a call that timed out keeps its slot until it returns
+        await self._semaphore.acquire()
+        fut = self.loop.run_in_executor(self._executor, func, *args)
+        fut.add_done_callback(self._release)
+        self.upstream_calls += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(fut), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+
+    def _release(self, fut: asyncio.Future):
+        self._semaphore.release()
+        if not fut.cancelled():
+            fut.exception()  # nobody may be waiting anymore, mark it retrieved
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        flight = self._inflight.get(key)
+        if flight is not None and flight[0] is task:
+            self._inflight.pop(key)
+
+    async def _run(self, key: Hashable, func: Callable, *args):
+        if key in self._inflight:
+            self.coalesced += 1
+        else:
+            task = self.loop.create_task(self._call(func, *args))
+            self._inflight[key] = [task, 0]
+            task.add_done_callback(lambda t: self._forget(key, t))
+        flight = self._inflight[key]
+        flight[1] += 1
+        try:
+            return await asyncio.shield(flight[0])
+        except asyncio.CancelledError:
+            if flight[1] == 1:
+                # last one waiting for this request
+                flight[0].cancel()
+                self._forget(key, flight[0])
+            raise
+        finally:
+            flight[1] -= 1
+
+    def submit(self, key: Hashable, func: Callable, *args) -> Future:
+        """ run func(*args) unless a call with the same key is in flight """
+        return asyncio.run_coroutine_threadsafe(self._run(key, func, *args),
+                                                self.loop)
+
+    def shutdown(self):
+        try:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        except RuntimeError:
+            pass  # loop already closed
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        LOG.debug(f"search core stopped: {self.stats}")
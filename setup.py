@@ -21,7 +21,7 @@ def find_resource_files():
     # add any folder with files your skill uses here! 
     resource_base_dirs = ("locale", "res", "vocab", "dialog", "regex", "skill")
     base_dir = path.dirname(__file__)
-    package_data = ["*.json"]
+    package_data = ["*.json", "*.csv"]
     for res in resource_base_dirs:
         if path.isdir(path.join(base_dir, res)):
             for (directory, _, files) in walk(path.join(base_dir, res)):
@@ -0,0 +1,141 @@
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from ovos_utils.log import LOG
+
+
+def ytdlp_resolver(watch_url: str) -> str:
+    """ best audio stream url of a youtube video, needs yt-dlp installed """
+    from yt_dlp import YoutubeDL  # optional dependency
+    opts = {"format": "bestaudio/best", "quiet": True, "no_warnings": True,
+            "noplaylist": True}
+    with YoutubeDL(opts) as ydl:
+        return ydl.extract_info(watch_url, download=False)["url"]
+
+
+def video_id_from_url(url: str) -> str:
+    return parse_qs(urlparse(url).query).get("v", [""])[0]
+
+
+def stream_expiry(stream_url: str, default_ttl: float = 3600) -> float:
+    """ unix time a signed googlevideo url stops working, read from its
+    expire= parameter, `default_ttl` seconds from now if it has none """
+    expire = parse_qs(urlparse(stream_url).query).get("expire")
+    try:
+        return float(expire[0])
+    except (TypeError, ValueError):
+        return time.time() + default_ttl
+
+
+class StreamResolver:
+    """ resolves playable audio stream urls ahead of playback
+
+    the best scored tracks of a search are resolved speculatively in a
+    small thread pool while OCP is still picking a result, stream urls
+    are cached by video id until `margin` seconds before their signed
+    url expires
+
+    `resolver` turns a watch url into a stream url, yt-dlp by default,
+    any callable can be plugged in
+    """
+
+    def __init__(self, resolver: Callable[[str], str] = ytdlp_resolver,
+                 max_workers: int = 2,
+                 max_entries: int = 50,
+                 margin: float = 300,
+                 default_ttl: float = 3600):
+        self.resolver = resolver
+        self.max_entries = max_entries
+        self.margin = margin
+        self.default_ttl = default_ttl
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="ytmus-stream")
+        self._streams = OrderedDict()  # video_id -> (stream url, expiry)
+        self._inflight = {}  # video_id -> Future
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.resolved = 0
+        self.errors = 0
+
+    @property
+    def stats(self) -> dict:
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "resolved": self.resolved,
+                "errors": self.errors,
+                "entries": len(self._streams),
+                "in_flight": len(self._inflight)}
+
+    def _cached(self, video_id: str) -> Optional[str]:
+        entry = self._streams.get(video_id)
+        if entry is None:
+            return None
+        url, expiry = entry
+        if expiry - self.margin <= time.time():
+            self._streams.pop(video_id)
+            return None
+        self._streams.move_to_end(video_id)
+        return url
+
+    def _resolve(self, video_id: str, watch_url: str) -> str:
+        try:
+            url = self.resolver(watch_url)
+            with self._lock:
+                self._streams[video_id] = (url, stream_expiry(url, self.default_ttl))
+                self._streams.move_to_end(video_id)
+                while len(self._streams) > self.max_entries:
+                    self._streams.popitem(last=False)
+                self.resolved += 1
+            return url
+        except Exception as e:
+            self.errors += 1
+            LOG.debug(f"failed to resolve stream for {watch_url}: {e}")
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(video_id, None)
+
+    def prefetch(self, video_id: str, watch_url: str) -> Optional[Future]:
+        """ start resolving a stream unless it is cached or in flight """
+        if not video_id:
+            return None
+        with self._lock:
+            if self._cached(video_id) is not None:
+                return None
+            fut = self._inflight.get(video_id)
+            if fut is None:
+                fut = self._pool.submit(self._resolve, video_id, watch_url)
+                self._inflight[video_id] = fut
+            return fut
+
+    def prefetch_best(self, candidates: Iterable[Tuple[float, str, str]],
+                      top_n: int = 3):
+        """ prefetch the `top_n` best (score, video_id, watch_url) candidates """
+        for _, video_id, watch_url in sorted(candidates, key=lambda c: c[0],
+                                             reverse=True)[:top_n]:
+            self.prefetch(video_id, watch_url)
+
+    def get(self, video_id: str, timeout: float = 0) -> Optional[str]:
+        """ cached stream url, waits up to `timeout` seconds for a pending
+        resolution, None if the stream was not resolved ahead of time """
+        with self._lock:
+            url = self._cached(video_id)
+            fut = self._inflight.get(video_id)
+        if url is None and fut is not None and timeout:
+            try:
+                url = fut.result(timeout)
+            except Exception:
+                pass  # timed out, failures are logged by _resolve
+        if url is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return url
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)